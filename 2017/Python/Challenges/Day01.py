@@ -10,22 +10,15 @@ def main(args: List[str]) -> None:
 
     # File read stub
     with open(args[1], "r") as f:
-        list: str = f.readline()
-        list += list[0]
-
-    captcha: int = 0
-    for i, n in enumerate(list[:-1]):
-        if n == list[i + 1]:
-            captcha += int(n)
+        digits: str = f.readline().strip()
 
+    # Compare each digit with the next one, by zipping with the sequence rotated by one
+    captcha: int = sum(map(int, (n for n, m in zip(digits, digits[1:] + digits[:1]) if n == m)))
     print(captcha)
 
-    captcha = 0
-    jump: int = len(list) // 2
-    for i, n in enumerate(list[:jump]):
-        if n == list[i + jump]:
-            captcha += int(n) * 2
-
+    # Compare with the digit halfway around, the rotation covers both halves at once
+    jump: int = len(digits) // 2
+    captcha = sum(map(int, (n for n, m in zip(digits, digits[jump:] + digits[:jump]) if n == m)))
     print(captcha)
 
 
@@ -19,24 +19,15 @@ def main(args: List[str]) -> None:
 
     checksum: int = 0
     for row in spreadsheet:
-        max_value: int = 0
-        min_value: int = 999999
-        for n in row:
-            max_value = max(max_value, n)
-            min_value = min(min_value, n)
-
-        checksum += max_value - min_value
+        checksum += max(row) - min(row)
 
     print(checksum)
 
     checksum = 0
     for row in spreadsheet:
-        for i, a in enumerate(row[:-1]):
-            for b in row[i + 1:]:
-                if a % b == 0:
-                    checksum += a // b
-                elif b % a == 0:
-                    checksum += b // a
+        # Sort in descending order so only the larger value ever needs to be divided by the smaller one
+        ordered: List[int] = sorted(row, reverse=True)
+        checksum += sum(a // b for i, a in enumerate(ordered[:-1]) for b in ordered[i + 1:] if a % b == 0)
 
     print(checksum)
 
@@ -1,5 +1,6 @@
 import sys
-from typing import List, Set
+from typing import List, Dict, Tuple
+from collections import defaultdict
 
 
 def main(args: List[str]) -> None:
@@ -10,32 +11,54 @@ def main(args: List[str]) -> None:
 
     # Final result
     frequency: int = 0
-    jumps: List[int] = []
-    frequencies: Set[int] = set()
+    frequencies: List[int] = []
 
-    # Read file for frequency jumps
+    # Read file for frequency jumps, keeping the frequency after each of them
     with open(args[1], "r") as f:
         for line in f:
-            jump: int = int(line)
-            jumps.append(jump)
-            frequency += jump
-            frequencies.add(frequency)
+            frequency += int(line)
+            frequencies.append(frequency)
 
     # Part one: final frequency
     print("Part one:", frequency)
 
-    # Loop through jumps until a duplicate is found
-    found: bool = False
-    while not found:
-        for jump in jumps:
-            frequency += jump
-            # If found, exit
-            if frequency in frequencies:
-                found = True
-                break
-
-            # If not, just add it to the set
-            frequencies.add(frequency)
+    # Frequencies only repeat in the next passes, shifted by a multiple of the drift of one whole pass
+    drift: int = frequency
+    if drift == 0:
+        # Without any drift, the second pass repeats the very first frequency
+        frequency = frequencies[0]
+    else:
+        # Work with a positive drift, flipping the frequencies if needed
+        sign: int = 1 if drift > 0 else -1
+        drift *= sign
+        # Frequencies can only reach each other if they have the same remainder by the drift
+        groups: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+        for i, value in enumerate(frequencies):
+            groups[(value * sign) % drift].append((value * sign, i))
+
+        # Repeats are stored as the amount of passes after the first one, the index in the pass, and the frequency
+        repeats: List[Tuple[int, int, int]] = []
+        for group in groups.values():
+            group.sort()
+            unique: List[Tuple[int, int]] = [group[0]]
+            for a, b in zip(group, group[1:]):
+                if a[0] == b[0]:
+                    # A frequency reached twice in the first pass repeats itself in the second pass
+                    repeats.append((1, b[1], b[0] + drift))
+                else:
+                    unique.append(b)
+
+            # Within each group, a frequency next repeats the closest higher one, after a whole amount of passes
+            for (value, i), (higher, _) in zip(unique, unique[1:]):
+                repeats.append(((higher - value) // drift, i, higher))
+
+        # Without any repeat, the frequencies drift away forever
+        if not repeats:
+            print("Part two: no repeated frequency")
+            return
+
+        # The first repeat is the one needing the least passes, then happening the earliest in its pass
+        frequency = min(repeats)[2] * sign
 
     print("Part two:", frequency)
 
@@ -1,34 +1,49 @@
 from __future__ import annotations
 import sys
-import re as regex
-from typing import List, Tuple, Pattern
-from Utils import Vector
+from typing import List, Set, Tuple, Dict, Final
 
 
-class Particle:
+# Parsing table, turns the delimiters into whitespace and removes the labels, leaving only the numbers
+separators: Final[Dict[int, int]] = str.maketrans("<>,", "   ", "positnvelcy=")
+
+
+class Particles:
     """
-    An object representing a particle, with a speed and position
+    An object representing a set of particles, with their speeds and positions stored component by component
     """
 
-    def __init__(self, px: int, py: int, vx: int, vy: int) -> None:
+    def __init__(self) -> None:
+        """
+        Creates a new empty set of Particles
+        """
+
+        self.px: List[int] = []
+        self.py: List[int] = []
+        self.vx: List[int] = []
+        self.vy: List[int] = []
+
+    def add(self, px: int, py: int, vx: int, vy: int) -> None:
         """
-        Creates a new Particle from a given position and velocity
+        Adds a new particle from a given position and velocity
         :param px: X position
         :param py: Y Position
         :param vx: X Velocity
         :param vy: Y Velocity
         """
 
-        self.position: Vector = Vector(px, py)
-        self.velocity: Vector = Vector(vx, vy)
+        self.px.append(px)
+        self.py.append(py)
+        self.vx.append(vx)
+        self.vy.append(vy)
 
     def update(self, seconds: int = 1) -> None:
         """
-        Updates the particles position to the given amount of seconds
-        :param seconds: Time in seconds to move the particle's position by
+        Updates the particles positions to the given amount of seconds
+        :param seconds: Time in seconds to move the particles positions by
         """
 
-        self.position += (self.velocity * seconds)
+        self.px = [x + (v * seconds) for x, v in zip(self.px, self.vx)]
+        self.py = [y + (v * seconds) for y, v in zip(self.py, self.vy)]
 
 
 def main(args: List[str]) -> None:
@@ -37,15 +52,13 @@ def main(args: List[str]) -> None:
     :param args: Argument list, should contain the file to load at index 1
     """
 
-    # Get patten and setup particle list
-    pattern: Pattern = regex.compile(r"position=<([-| ]\d+), ([-| ]\d+)> velocity=<([-| ]\d+), ([-| ]\d+)>")
-    particles: List[Particle] = []
+    # Setup particle list
+    particles: Particles = Particles()
 
     # File read stub
     with open(args[1], "r") as f:
         for line in f:
-            particle: Particle = Particle(*map(int, pattern.search(line).groups()))
-            particles.append(particle)
+            particles.add(*map(int, line.translate(separators).split()))
 
     # Loop forward time until the particles are close enough to each other
     seconds: int = 0
@@ -55,8 +68,7 @@ def main(args: List[str]) -> None:
         jump: int = min(diffx, diffy) // 25
         seconds += jump
         # Update all particles
-        for p in particles:
-            p.update(jump)
+        particles.update(jump)
 
         # Get new diff
         diffx, diffy = get_diff(particles)
@@ -66,23 +78,22 @@ def main(args: List[str]) -> None:
         # Get draw bounds
         max_x, min_x, max_y, min_y = get_extremums(particles)
         print(f"After {seconds} seconds:")
+        # Mark the occupied cells once, instead of looking through all the particles for each cell
+        occupied: Set[Tuple[int, int]] = set(zip(particles.px, particles.py))
         # Loop through bounds
-        data: str = ""
+        rows: List[str] = []
         for y in range(min_y, max_y + 1):
-            for x in range(min_x, max_x + 1):
-                # u25A0 is the unicode black square character
-                data += u"\u25A0" if any(p.position.x == x and p.position.y == y for p in particles) else " "
-            data += "\n"
+            # u25A0 is the unicode black square character
+            rows.append("".join(u"\u25A0" if (x, y) in occupied else " " for x in range(min_x, max_x + 1)))
         # Print resulting data
-        print(data)
+        print("\n".join(rows) + "\n")
 
         # Update by another second
         seconds += 1
-        for p in particles:
-            p.update()
+        particles.update()
 
 
-def get_diff(particles: List[Particle]) -> Tuple[int, int]:
+def get_diff(particles: Particles) -> Tuple[int, int]:
     """
     Gets the difference between the highest and lowest points in both dimensions for all provided particles
     :param particles: Particles to get the difference for
@@ -94,17 +105,17 @@ def get_diff(particles: List[Particle]) -> Tuple[int, int]:
     return max_x - min_x, max_y - min_y
 
 
-def get_extremums(particles: List[Particle]) -> Tuple[int, int, int, int]:
+def get_extremums(particles: Particles) -> Tuple[int, int, int, int]:
     """
     Gets the maximums and minimums in both dimensions for all the supplied particles
     :param particles: Particles to get the extremums for
     :return: A tuple containing in sequence, the max x value, min x value, max y value, and min y value
     """
 
-    max_x: int = max(p.position.x for p in particles)
-    min_x: int = min(p.position.x for p in particles)
-    max_y: int = max(p.position.y for p in particles)
-    min_y: int = min(p.position.y for p in particles)
+    max_x: int = max(particles.px)
+    min_x: int = min(particles.px)
+    max_y: int = max(particles.py)
+    min_y: int = min(particles.py)
     return max_x, min_x, max_y, min_y
 
 
@@ -1,5 +1,6 @@
 import sys
 from typing import List, Tuple
+from itertools import accumulate
 
 
 def main(args: List[str]) -> None:
@@ -10,65 +11,59 @@ def main(args: List[str]) -> None:
 
     # Setup data
     width: int = 301
-    # We're not using Grid yet here because this algorithm is already too slow and adding another layer won't help
-    grid: List[List[int]] = [[0] * width for _ in range(width)]
+    grid: List[List[int]] = [[0] * width]
 
     with open(args[1], "r") as f:
         serial: int = int(f.readline().strip())
 
-    # Setup power in the grid
+    # Setup power in the grid, a whole column at a time, extracting the third digit
     for x in range(1, width):
-        for y in range(1, width):
-            rack: int = x + 10
-            power: int = rack * y
-            power += serial
-            power *= rack
-            power = (power // 100) % 10  # Extracting the third digit
-            power -= 5
-            grid[x][y] = power
+        rack: int = x + 10
+        grid.append([0] + [((((rack * y) + serial) * rack // 100) % 10) - 5 for y in range(1, width)])
 
-    top: int = 0
-    best: Tuple[int, int]
-    for x in range(1, width - 3):
-        for y in range(1, width - 3):
-            curr: int = 0
-            # Loop through increasing sizes
-            for i in range(x, x + 3):
-                for j in range(y, y + 3):
-                    curr += grid[i][j]
-
-            # Test size
-            if curr > top:
-                top = curr
-                best = (x, y)
+    # Build the summed-area table, so that the sum of any square takes only a few operations
+    sat: List[List[int]] = [[0] * width]
+    for x in range(1, width):
+        sat.append([row + above for row, above in zip(accumulate(grid[x]), sat[x - 1])])
 
-    print(f"Part one coordinates {best} with score {top}\n")
+    top, x, y = best_square(sat, 3)
+    print(f"Part one coordinates {(x, y)} with score {top}\n")
 
     top = 0
-    best: Tuple[int, int, int]
-    # Loop through top left coordinates
-    for x in range(1, width):
-        for y in range(1, width):
-            curr: int = 0
-            # Loop through increasing sizes
-            for size in range(width - max(x, y)):
-                # Add the vertical rightmost band
-                i: int = x + size
-                for j in range(y, y + size + 1):
-                    curr += grid[i][j]
+    best: Tuple[int, int, int] = (0, 0, 0)
+    # Loop through all the possible sizes
+    for size in range(1, width):
+        curr, x, y = best_square(sat, size)
+        # Test size, on ties keep the first coordinates
+        if curr > top or (curr == top and (x, y) < best[:2]):
+            top = curr
+            best = (x, y, size)
+            print(f"Temporary new best {best} with score {top}")
 
-                # Add the horizontal bottom band
-                j: int = y + size
-                for i in range(x, x + size):
-                    curr += grid[i][j]
+    print(f"\nPart two coordinates {best} with score {top}")
 
-                # Test size
-                if curr > top:
-                    top = curr
-                    best = (x, y, size + 1)
-                    print(f"Temporary new best {best} with score {top}")
 
-    print(f"\nPart two coordinates {best} with score {top}")
+def best_square(sat: List[List[int]], size: int) -> Tuple[int, int, int]:
+    """
+    Finds the square of the given size with the highest total power
+    :param sat: Summed-area table of the power grid
+    :param size: Size of the squares
+    :return: A tuple containing the total power of the best square, then its top left x and y coordinates
+    """
+
+    top: int = -sys.maxsize
+    best: Tuple[int, int] = (0, 0)
+    # Loop through the top rows of the squares
+    for x in range(1, len(sat) - size + 1):
+        # Column sums over the rows of the squares, then the sum of each square along the row
+        columns: List[int] = [lower - upper for lower, upper in zip(sat[x + size - 1], sat[x - 1])]
+        sums: List[int] = [right - left for left, right in zip(columns, columns[size:])]
+        curr: int = max(sums)
+        if curr > top:
+            top = curr
+            best = (x, sums.index(curr) + 1)
+
+    return (top, *best)
 
 
 # Only run if entry point
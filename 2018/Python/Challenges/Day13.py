@@ -1,38 +1,29 @@
 from __future__ import annotations
 import sys
 import re as regex
-from typing import List, Dict, Set, Optional, Pattern
-from enum import Enum
-from itertools import chain
-from Utils import Vector, Direction, Grid
+from typing import List, Dict, Set, Tuple, Optional, Callable, Pattern, Final
 
 
-class Rail(str, Enum):
-    """
-    Rail enum representation
-    """
+# Cart parsing pattern, and cart to underlying rail translation table
+cart_pattern: Final[Pattern] = regex.compile(r"[\^v<>]")
+cart_to_rail: Final[Dict[int, int]] = str.maketrans("^v<>", "||--")
 
-    # Enum members
-    RAIL_VERTICAL = '|'
-    RAIL_HORIZONTAL = '-'
-    INTERSECTION = '+'
-    CORNER_RIGHT = '/'
-    CORNER_LEFT = '\\'
-    NONE = ' '
-
-    def turn(self, heading: Direction) -> Direction:
-        """
-        Turns the direction according to this rail corner
-        :param heading: Current heading direction
-        :return: Resulting heading direction. If the rail is not a corner rail, the heading stays the same.
-        """
 
-        # Turn correctly if on corner tile
-        if self == Rail.CORNER_RIGHT:
-            return Direction((-heading.y, -heading.x))
-        elif self == Rail.CORNER_LEFT:
-            return Direction((heading.y, heading.x))
-        return heading
+# Turning function type alias, taking and returning a (dx, dy) heading
+Turn = Callable[[int, int], Tuple[int, int]]
+# Rail corner to turning function table
+corner_turns: Final[Dict[str, Turn]] = {
+    '/': lambda dx, dy: (-dy, -dx),
+    '\\': lambda dx, dy: (dy, dx)
+}
+# Intersection turning functions (left, straight, right), indexed by the cart's current choice,
+# and the choice that follows each one
+intersection_turns: Final[Tuple[Turn, Turn, Turn]] = (
+    lambda dx, dy: (dy, -dx),
+    lambda dx, dy: (dx, dy),
+    lambda dx, dy: (-dy, dx)
+)
+next_choice: Final[Tuple[int, int, int]] = (1, 2, 0)
 
 
 class Cart:
@@ -40,8 +31,11 @@ class Cart:
     Cart evolving through the rail system
     """
 
-    # String/Direction parsing dictionary
-    _parse: Dict[str, Direction] = {'^': Direction.UP, 'v': Direction.DOWN, '>': Direction.RIGHT, '<': Direction.LEFT}
+    # Plain int fields only, the cart is updated in the hot loop
+    __slots__ = ("x", "y", "dx", "dy", "_choice", "_rails", "_width")
+
+    # String/heading parsing dictionary
+    _parse: Dict[str, Tuple[int, int]] = {'^': (0, -1), 'v': (0, 1), '>': (1, 0), '<': (-1, 0)}
 
     @classmethod
     def create_cart(cls, x: int, y: int, heading: str) -> Optional[Cart]:
@@ -55,51 +49,57 @@ class Cart:
 
         # Check if the heading is valid
         if heading in cls._parse:
-            return Cart(Vector(x, y), cls._parse[heading])
+            return Cart(x, y, *cls._parse[heading])
         # If not, return nothing
         return None
 
-    def __init__(self, position: Vector, direction: Direction) -> None:
+    def __init__(self, x: int, y: int, dx: int, dy: int) -> None:
         """
         Creates a new Cart
-        :param position: Position of the cart in the grid
-        :param direction: Direction this cart is facing
+        :param x: X position of the cart in the grid
+        :param y: Y position of the cart in the grid
+        :param dx: X component of the direction this cart is facing
+        :param dy: Y component of the direction this cart is facing
         """
 
         # Setup variables
-        self._grid: Optional[Grid[Rail]] = None
-        self.pos: Vector = position
-        self.direction: Direction = direction
+        self.x: int = x
+        self.y: int = y
+        self.dx: int = dx
+        self.dy: int = dy
         self._choice: int = 0
+        self._rails: str = ""
+        self._width: int = 0
 
-    def set_grid(self, grid: Grid[Rail]) -> None:
+    def set_grid(self, rails: str, width: int) -> None:
         """
         Sets the grid this cart evolves in
-        :param grid: Grid to set
+        :param rails: Flattened rail grid, row by row
+        :param width: Width of a row of the grid
         """
 
-        self._grid = grid
+        self._rails = rails
+        self._width = width
 
     def update(self) -> None:
         """
         Updates the position of the cart by moving it in the grid
         """
 
-        # Get current underneath Rail piece
-        current: Rail = self._grid[self.pos]
+        # Get current underneath rail piece
+        current: str = self._rails[(self.y * self._width) + self.x]
 
         # If on corner tile, turn
-        if current == Rail.CORNER_RIGHT or current == Rail.CORNER_LEFT:
-            self.direction = current.turn(self.direction)
+        turn: Optional[Turn] = corner_turns.get(current)
+        if turn:
+            self.dx, self.dy = turn(self.dx, self.dy)
         # Handle intersections as well
-        elif current == Rail.INTERSECTION:
-            if self._choice == 0:
-                self.direction = self.direction.turn_left()
-            elif self._choice == 2:
-                self.direction = self.direction.turn_right()
-            self._choice = (self._choice + 1) % 3
+        elif current == '+':
+            self.dx, self.dy = intersection_turns[self._choice](self.dx, self.dy)
+            self._choice = next_choice[self._choice]
 
-        self.pos += self.direction
+        self.x += self.dx
+        self.y += self.dy
 
 
 def main(args: List[str]) -> None:
@@ -110,9 +110,6 @@ def main(args: List[str]) -> None:
 
     data: List[str] = []
     carts: List[Cart] = []
-    pattern: Pattern = regex.compile(r"[\^v<>]")
-    vertical: Pattern = regex.compile(r"[\^v]")
-    horizontal: Pattern = regex.compile("[<>]")
     width: int = 0
 
     # File read stub
@@ -129,41 +126,52 @@ def main(args: List[str]) -> None:
             line = line.rstrip("\n")
 
             # Get all carts
-            for match in pattern.finditer(line):
+            for match in cart_pattern.finditer(line):
                 cart: Cart = Cart.create_cart(match.start(), i, match.group())
                 if cart:
                     carts.append(cart)
 
             # Replace carts by rails
-            line = regex.sub(vertical, '|', line)
-            line = regex.sub(horizontal, '-', line)
-            data.append(line)
+            data.append(line.translate(cart_to_rail))
 
-    # Create and set grid
-    grid: Grid[Rail] = Grid.populate_new(len(data[0]), len(data), chain.from_iterable(data), Rail)
+    # Flatten the rails and set them as the grid
+    rails: str = "".join(data)
     for cart in carts:
-        cart.set_grid(grid)
+        cart.set_grid(rails, len(data[0]))
 
+    # Map of the occupied positions to the cart on them, used to detect collisions
+    positions: Dict[Tuple[int, int], Cart] = {(cart.x, cart.y): cart for cart in carts}
     # As long as there is more than one car going around
     crashed: Set[Cart] = set()
     while len(carts) > 1:
         # Update carts in order, starting at the top left through the bottom right
-        for cart in sorted(carts, key=lambda x: x.pos):
+        # The list barely changes order between ticks, so sorting it in place on a plain tuple is close to linear
+        carts.sort(key=lambda x: (x.y, x.x))
+        for cart in carts:
+            # Carts that crashed earlier this tick do not move anymore
+            if cart in crashed:
+                continue
+
+            # Free the current position and move the cart
+            del positions[(cart.x, cart.y)]
             cart.update()
-            for c in carts:
-                # Check for collisions
-                if c is not cart and c not in crashed and c.pos == cart.pos:
-                    crashed.add(cart)
-                    crashed.add(c)
-                    print("Crashed happened at location", cart.pos)
-                    break
-
-        # Removed crashed carts
-        while crashed:
-            carts.remove(crashed.pop())
+            # Check for collisions
+            position: Tuple[int, int] = (cart.x, cart.y)
+            other: Optional[Cart] = positions.pop(position, None)
+            if other:
+                crashed.add(cart)
+                crashed.add(other)
+                print("Crashed happened at location", position)
+            else:
+                positions[position] = cart
+
+        # Removed crashed carts, in a single pass over the list
+        if crashed:
+            carts = [cart for cart in carts if cart not in crashed]
+            crashed.clear()
 
     # Print final cart
-    print("Final cart location:", carts[0].pos)
+    print("Final cart location:", (carts[0].x, carts[0].y))
 
 
 # Only run if entry point
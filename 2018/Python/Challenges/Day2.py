@@ -1,6 +1,5 @@
 import sys
-from typing import List, Set
-from collections import Counter
+from typing import List, Set, Dict
 
 
 def main(args: List[str]) -> None:
@@ -16,8 +15,9 @@ def main(args: List[str]) -> None:
     # Read file
     with open(args[1], "r") as f:
         for line in f:
-            ids.append(line)
-            counts: Set[int] = set(Counter(line).values())
+            ids.append(line.strip())
+            # Count each distinct character with str.count, which runs in C
+            counts: Set[int] = {line.count(c) for c in set(line)}
             if 2 in counts:
                 twos += 1
             if 3 in counts:
@@ -25,36 +25,20 @@ def main(args: List[str]) -> None:
 
     print("Part one checksum:", twos * threes)
 
-    # While the list has more than one element
-    while len(ids) > 1:
-        # Get last element, keep the rest for the secondary loop
-        first: str = ids.pop()
-        # Get second element
-        for second in ids:
-            mismatch: bool = False
-            diff: str = ""
-
-            # Check character by character
-            a: str
-            b: str
-            for a, b in zip(first, second):
-                # If mismatch
-                if a != b:
-                    # If a mismatch was already found, break out
-                    if mismatch:
-                        break
-                    # Else raise mismatch flag
-                    mismatch = True
-
-                # If not mismatched, add character to the diff
-                else:
-                    diff += a
-
-            # If only one mismatch, the target has been found
-            else:
-                if mismatch:
-                    print("Part two diff:", diff)
-                    return
+    # Without any ID there is nothing to compare
+    if not ids:
+        return
+
+    # Two IDs differing by a single character are equal once that character is removed from both
+    for i in range(len(ids[0])):
+        seen: Dict[str, str] = {}
+        for box in ids:
+            # Remove the character at this position, and check if a different ID gave the same result
+            diff: str = box[:i] + box[i + 1:]
+            original: str = seen.setdefault(diff, box)
+            if original != box:
+                print("Part two diff:", diff)
+                return
 
 
 # Only run if entry point
@@ -1,21 +1,24 @@
 import sys
 import re as regex
-from typing import List, Dict, Tuple, Pattern
-from Utils import Grid
+from typing import List, Dict, Tuple, Pattern, Final
 
 # Type aliases
 Rect = Tuple[int, int, int, int]
 
 
+# Use count increment table, counts above one stay at two since only overlaps matter
+increment: Final[bytes] = bytes([1, 2] + [2] * 254)
+
+
 def main(args: List[str]) -> None:
     """
     Application entry point
     :param args: Argument list, should contain the file to load at index 1
     """
 
-    # Create fabric tile
+    # Create fabric tile, one row of use counts per x coordinate
     width: int = 1000
-    fabric: Grid[int] = Grid(width, width, 0)
+    fabric: List[bytearray] = [bytearray(width) for _ in range(width)]
     # Regex match for input
     pattern: Pattern = regex.compile(r"#(\d+) @ (\d+),(\d+): (\d+)x(\d+)")
     claims: Dict[int, Rect] = {}
@@ -32,28 +35,18 @@ def main(args: List[str]) -> None:
             req, x, y, w, h = map(int, pattern.search(line).groups())
             claims[req] = (x, y, w, h)
 
-            # Increment use count on the fabric for this request
-            for i in range(x, x + w):
-                for j in range(y, y + h):
-                    fabric[(i, j)] += 1
+            # Increment use count on the fabric for this request, a whole row slice at a time
+            for row in fabric[x:x + w]:
+                row[y:y + h] = row[y:y + h].translate(increment)
 
     # Get amount of squares with more than one request access
-    count: int = sum(1 for i in fabric if i > 1)
+    count: int = sum(row.count(2) for row in fabric)
     print("Part one count:", count)
 
     # Loop through all requests
     for req, (x, y, w, h) in claims.items():
-        # Get request data
-        for i in range(x, x + w):
-            for j in range(y, y + h):
-                # If not 1, another request overlaps
-                if fabric[(i, j)] != 1:
-                    break
-            else:
-                continue
-            break
-        # Both loops exited normally, match found
-        else:
+        # If any square is not 1, another request overlaps
+        if all(row.count(1, y, y + h) == h for row in fabric[x:x + w]):
             print("Part two ID:", req)
             return
 
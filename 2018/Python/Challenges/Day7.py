@@ -1,22 +1,27 @@
 from __future__ import annotations
 import sys
 import string
+import heapq
 import re as regex
 from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List, Dict, Set, Optional, Pattern
+from typing import List, Dict, Tuple, Optional, Pattern, Final
+
+
+# Step requirement parsing pattern
+pattern: Final[Pattern] = regex.compile("Step ([A-Z]) must be finished before step ([A-Z]) can begin.")
 
 
 @dataclass
 class Task:
     """
-    Task object, holds a reference to required task to proceed, as well as tasks unlocked by this
+    Task object, holds the amount of tasks required to proceed, as well as tasks unlocked by this
     """
 
     # Class fields
     key: str
-    requirements: Set[Task] = field(default_factory=set)
-    unlocks: Set[Task] = field(default_factory=set)
+    requirements: int = 0
+    unlocks: List[Task] = field(default_factory=list)
 
     def add_requirement(self, required: Task) -> None:
         """
@@ -25,26 +30,21 @@ class Task:
         :param required: Required task for this task
         """
 
-        # Add required to requirement, then self to unlocks of requirement
-        self.requirements.add(required)
-        required.unlocks.add(self)
+        # Increment the requirement count, then add self to unlocks of requirement
+        self.requirements += 1
+        required.unlocks.append(self)
 
-    def complete(self) -> None:
+    def complete(self, ready: List[str]) -> None:
         """
         Completes this step and removes it as a requirement for children steps
+        :param ready: Heap of the keys of the tasks ready to be done, newly unlocked tasks are pushed to it
         """
         # Loop through all the steps they unlock
         for unlock in self.unlocks:
-            # Remove that requirement from the instruction
-            unlock.requirements.remove(self)
-
-    def __hash__(self) -> int:
-        """
-        Hashes this Task, according to the key
-        :return: Hash of the key
-        """
-
-        return hash(self.key)
+            # Remove that requirement from the instruction, and mark it as ready if none are left
+            unlock.requirements -= 1
+            if unlock.requirements == 0:
+                heapq.heappush(ready, unlock.key)
 
 
 @dataclass
@@ -72,9 +72,10 @@ class Worker:
             return True
         return False
 
-    def update(self) -> bool:
+    def update(self, ready: List[str]) -> bool:
         """
         Updates the worker and tries to complete the task
+        :param ready: Heap of the keys of the tasks ready to be done
         :return: True if the assigned task was completed this turn, false otherwise
         """
 
@@ -84,7 +85,7 @@ class Worker:
             self.time -= 1
             # If not time is left, remove task
             if self.time == 0:
-                self.task.complete()
+                self.task.complete(ready)
                 self.task = None
                 return True
             # If task not complete, return False
@@ -99,63 +100,47 @@ def main(args: List[str]) -> None:
     :param args: Argument list, should contain the file to load at index 1
     """
 
+    # Read the requirement edges from file, only once
+    with open(args[1], "r") as f:
+        edges: List[Tuple[str, str]] = [pattern.search(line).groups() for line in f]
+
     # Setup data structures
-    tasks: Dict[str, Task] = OrderedDict([(key, Task(key)) for key in string.ascii_uppercase])
-    pattern: Pattern = regex.compile("Step ([A-Z]) must be finished before step ([A-Z]) can begin.")
+    tasks: Dict[str, Task] = build_tasks(edges)
 
-    # Read from file
-    with open(args[1], "r") as f:
-        for line in f:
-            # Get tasks and set requirements
-            requirement: Task
-            required: Task
-            requirement, required = (tasks[t] for t in pattern.search(line).groups())
-            required.add_requirement(requirement)
-
-    # Setup final sequence
-    sequence: str = ""
-    # While instructions aren't empty
-    while tasks:
-        # Loop through all the instructions
-        for task in tasks.values():
-            # If they have no requirements left
-            if not task.requirements:
-                # Remove locks from this task
-                task.complete()
+    # Setup final sequence, and the heap of tasks ready to be done
+    sequence: List[str] = []
+    ready: List[str] = get_ready(tasks)
+    # While some instructions are ready to be done
+    while ready:
+        # Get the first ready instruction in alphabetical order
+        task: Task = tasks[heapq.heappop(ready)]
+        # Remove locks from this task
+        task.complete(ready)
 
-                # Delete that instruction from the set of instructions to run, and add it to the sequence
-                del tasks[task.key]
-                sequence += task.key
-                break
+        # Add it to the sequence
+        sequence.append(task.key)
 
-    print("Part one sequence:", sequence)
+    print("Part one sequence:", "".join(sequence))
 
     # Recreate tasks structure
-    tasks = OrderedDict([(key, Task(key)) for key in string.ascii_uppercase])
-    # Read from file
-    with open(args[1], "r") as f:
-        for line in f:
-            # Get tasks and set requirements
-            requirement, required = (tasks[t] for t in pattern.search(line).groups())
-            required.add_requirement(requirement)
+    tasks = build_tasks(edges)
 
     # Setup worker info
     elapsed: int = 0
+    ready = get_ready(tasks)
     workers: List[Worker] = [Worker() for _ in range(5)]
     # Loop through tasks to assign
     while tasks:
         # Try to assign all workers
         for worker in workers:
-            # If not task assigned
-            if not worker.task:
-                # Try giving the next possible assignable task
-                if worker.assign(next((s for s in tasks.values() if not s.requirements), None)):
-                    # If a task has been assigned, delete it from the list
-                    del tasks[worker.task.key]
+            # If no task assigned, try giving the next possible assignable task
+            if not worker.task and ready:
+                # If a task has been assigned, delete it from the list
+                worker.assign(tasks.pop(heapq.heappop(ready)))
 
         # Update all workers
         for worker in workers:
-            worker.update()
+            worker.update(ready)
 
         # Increment counter
         elapsed += 1
@@ -166,7 +151,7 @@ def main(args: List[str]) -> None:
         # Loop through all workers
         for i, worker in enumerate(workers):
             # Update the worker and add him to the "to delete" list if complete
-            if worker.update():
+            if worker.update(ready):
                 deleted.append(i)
 
         # Remove workers that have finished
@@ -179,6 +164,32 @@ def main(args: List[str]) -> None:
     print("Part two time:", elapsed)
 
 
+def build_tasks(edges: List[Tuple[str, str]]) -> Dict[str, Task]:
+    """
+    Creates the task graph from the given requirement edges
+    :param edges: List of (requirement, required) task key pairs
+    :return: Dictionary of all the tasks, by key
+    """
+
+    tasks: Dict[str, Task] = OrderedDict([(key, Task(key)) for key in string.ascii_uppercase])
+    # Set all the requirements
+    for requirement, required in edges:
+        tasks[required].add_requirement(tasks[requirement])
+    return tasks
+
+
+def get_ready(tasks: Dict[str, Task]) -> List[str]:
+    """
+    Gets the keys of all the tasks with no requirements, as a heap
+    :param tasks: Tasks to look through
+    :return: A heap containing the keys of all the tasks that can be done right away
+    """
+
+    ready: List[str] = [key for key, task in tasks.items() if task.requirements == 0]
+    heapq.heapify(ready)
+    return ready
+
+
 # Only run if entry point
 if __name__ == "__main__":
     main(sys.argv)
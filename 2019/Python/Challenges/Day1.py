@@ -21,12 +21,11 @@ def main(args: List[str]) -> None:
     fuel: int = sum(modules)
     print(fuel)
 
-    # For each amount of fuel, calculate the extra needed fuel
-    for amount in modules:
-        extra: int = (amount // 3) - 2
-        while extra > 0:
-            fuel += extra
-            extra = (extra // 3) - 2
+    # Calculate the extra needed fuel for all the modules at once, dropping those which need no more
+    extra: List[int] = modules
+    while extra:
+        extra = [amount for amount in ((amount // 3) - 2 for amount in extra) if amount > 0]
+        fuel += sum(extra)
     print(fuel)
 
 
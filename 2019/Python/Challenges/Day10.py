@@ -1,6 +1,9 @@
 import sys
-from typing import List, Set, Optional
-from utils import Vector
+import math
+import operator
+from typing import List, Set, Dict, Tuple
+from collections import defaultdict
+from utils import Vector, Direction
 
 
 def main(args: List[str]) -> None:
@@ -9,26 +12,32 @@ def main(args: List[str]) -> None:
     :param args: Argument list, should contain the file to load at index 1
     """
 
-    asteroids: Set[Vector] = set()
+    # Asteroids are kept as plain coordinate tuples
+    asteroids: Set[Tuple[int, int]] = set()
     # File read stub
     with open(args[1], "r") as f:
         for y, line in enumerate(f):
             for x, c in enumerate(line.strip()):
                 if c == "#":
-                    asteroids.add(Vector(x, y))
+                    asteroids.add((x, y))
 
-    station: Vector = Vector(0, 0)
-    best: int = 0
-    for asteroid in asteroids:
-        angles: Set[float] = set()
-
-        for target in asteroids:
-            if asteroid == target:
-                continue
-
-            angles.add(Vector.direction(target - asteroid))
+    # Coordinates of every asteroid, so that the directions from one asteroid to all the others are computed in bulk
+    positions: List[Tuple[int, int]] = list(asteroids)
+    xs: List[int] = [x for x, _ in positions]
+    ys: List[int] = [y for _, y in positions]
 
-        visible = len(angles)
+    station: Tuple[int, int] = (0, 0)
+    best: int = 0
+    for i, asteroid in enumerate(positions):
+        # Every distinct direction to another asteroid is a visible asteroid
+        ax, ay = asteroid
+        dx: List[int] = [x - ax for x in xs]
+        dy: List[int] = [y - ay for y in ys]
+        # Drop the asteroid itself
+        del dx[i], dy[i]
+        # Directions are the offsets reduced by their GCD, which needs no trigonometry
+        divisors: List[int] = list(map(math.gcd, dx, dy))
+        visible: int = len(set(zip(map(operator.floordiv, dx, divisors), map(operator.floordiv, dy, divisors))))
         if visible > best:
             best = visible
             station = asteroid
@@ -36,27 +45,27 @@ def main(args: List[str]) -> None:
     print(best)
 
     asteroids.remove(station)
-    last_destroyed: Vector = Vector(0, 0)
-    last_direction: Vector = Vector(-1E-6, -1)
-    for _ in range(200):
-        if len(asteroids) == 0:
-            break
-        smallest: float = 360.0
-        to_destroy: Optional[Vector] = None
-        for target in sorted(asteroids, key=lambda a: Vector.distance(station, a)):
-            angle = Vector.angle(last_direction, target - station)
-
-            if smallest > angle > 0:
-                smallest = angle
-                to_destroy = target
+    # Group the other asteroids by their exact direction from the station, nearest first
+    sx, sy = station
+    lines: Dict[Tuple[int, int], List[Tuple[int, int]]] = defaultdict(list)
+    # Squared distances sort the same way as the distances, without any square root
+    for target in sorted(asteroids, key=lambda a: ((a[0] - sx) ** 2) + ((a[1] - sy) ** 2)):
+        ox, oy = target[0] - sx, target[1] - sy
+        divisor: int = math.gcd(ox, oy)
+        lines[(ox // divisor, oy // divisor)].append(target)
 
-        if to_destroy is None:
-            to_destroy = next(iter(asteroids))
-        asteroids.remove(to_destroy)
-        last_destroyed = to_destroy
-        last_direction = to_destroy - station
+    # Sweep the directions clockwise, starting straight up, with the nearest asteroid at the end of each line
+    directions: List[Tuple[int, int]] = sorted(lines, key=lambda d: Vector.angle(Direction.UP, Vector(*d)))
+    sweep: List[List[Tuple[int, int]]] = [lines[d][::-1] for d in directions]
+    # Every rotation of the laser destroys the nearest asteroid left on each line
+    destroyed: List[Tuple[int, int]] = []
+    while sweep and len(destroyed) < 200:
+        destroyed.extend(line.pop() for line in sweep)
+        sweep = [line for line in sweep if line]
 
-    print(last_destroyed.x * 100 + last_destroyed.y)
+    # With no other asteroid to destroy, the last destroyed one stays at the origin
+    x, y = destroyed[min(199, len(destroyed) - 1)] if destroyed else (0, 0)
+    print(x * 100 + y)
 
 
 # Only run if entry point
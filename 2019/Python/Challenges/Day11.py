@@ -1,8 +1,6 @@
 import sys
-from typing import List, Set, Tuple, Final
-from utils import IntcodeComp, Grid, Vector, Direction
-from threading import Thread
-import time
+from typing import List, Set, Tuple, Optional, Iterator, Callable, Final
+from utils import IntcodeComp, Grid
 
 
 def main(args: List[str]) -> None:
@@ -13,7 +11,7 @@ def main(args: List[str]) -> None:
 
     # File read stub
     with open(args[1], "r") as f:
-        comp: IntcodeComp = IntcodeComp(f.readline().strip(), threaded=True)
+        comp: IntcodeComp = IntcodeComp(f.readline().strip())
 
     _, painted = paint_hull(comp, False)
     print(painted)
@@ -32,47 +30,51 @@ def paint_hull(robot: IntcodeComp, start_white: bool) -> Tuple[Grid, int]:
 
     # Setup
     size: Final[int] = 150
+    width: Final[int] = size + 1
     black: Final[str] = " "
     white: Final[str] = "▓"
-    painted: Set[Vector] = set()
-    direction: Direction = Direction.UP
-
-    # Create hull
-    position: Vector = Vector(size // 2, size // 2)
-    hull: Grid[str] = Grid(size + 1, size + 1, black)
+    painted: Set[int] = set()
+    # Heading of the robot, starting upwards
+    dx: int = 0
+    dy: int = -1
+
+    # Create hull, flattened row by row, where white tiles are 1 and black tiles 0
+    x: int = size // 2
+    y: int = size // 2
+    hull: bytearray = bytearray(width * width)
     # Set the starting tile to white if asked
     if start_white:
-        hull[position] = white
+        hull[(y * width) + x] = 1
 
-    # Start the thread that the robot operates in
-    thread: Thread = Thread(target=robot.run_program)
-    thread.start()
+    # Start the robot's program
+    program: Iterator[Optional[int]] = robot.run_coroutine()
+    # Bind the methods used every step once, outside of the loop
+    add_input: Callable[[int], None] = robot.add_input
+    next_output: Callable[[], Optional[int]] = program.__next__
+    mark_painted: Callable[[int], None] = painted.add
 
     # Loop until the robot is done
-    while True:
-        # Input the current tile
-        robot.add_input(int(hull[position] == white))
-        # Wait for the output buffer to fill out (or the robot to be done)
-        while thread.is_alive() and len(robot.output_buffer) < 2:
-            time.sleep(1E-6)
-
-        # If the robot shuts off, we are done
-        if not thread.is_alive():
-            break
+    for colour in program:
+        # Index of the current tile in the hull
+        index: int = (y * width) + x
+        # If the robot is waiting for input, give it the current tile
+        if colour is None:
+            add_input(hull[index])
+            continue
 
         # Paint the new position accordingly
-        hull[position] = white if bool(robot.next_output()) else black
-        painted.add(position)
+        hull[index] = colour
+        mark_painted(index)
         # Move in the correct direction
-        if bool(robot.next_output()):
-            direction = direction.turn_right()
+        if bool(next_output()):
+            dx, dy = -dy, dx
         else:
-            direction = direction.turn_left()
-        position = position.move_towards(direction)
+            dx, dy = dy, -dx
+        x += dx
+        y += dy
 
-    # Join the robot thread and return
-    thread.join()
-    return hull, len(painted)
+    # Create the displayable hull and return
+    return Grid.populate_new(width, width, hull, lambda c: white if c else black), len(painted)
 
 
 # Only run if entry point
@@ -1,30 +1,11 @@
 import sys
 import operator
-from typing import List, Set, Tuple
-from dataclasses import dataclass
-from copy import deepcopy
+from typing import List, Dict, Final
 import math
-import re as regex
 
-# State type hint
-State = Tuple[int, int]
 
-
-@dataclass
-class Moon:
-    """
-    Represents a Moon, with its position and velocity
-    """
-    position: List[int]
-    velocity: List[int]
-
-    def to_state(self, axis: int) -> State:
-        """
-        Returns the state tuple for a given axis
-        :param axis: Axis (x, y, or z) to get the state for
-        :return: A tuple representing the position and velocity on the specified axis
-        """
-        return self.position[axis], self.velocity[axis]
+# Parsing table, turns the delimiters into whitespace and removes the labels, leaving only the numbers
+separators: Final[Dict[int, int]] = str.maketrans("<>,", "   ", "xyz=")
 
 
 def main(args: List[str]) -> None:
@@ -33,75 +14,71 @@ def main(args: List[str]) -> None:
     :param args: Argument list, should contain the file to load at index 1
     """
 
-    start: List[Moon] = []
+    # Starting position of the moons, on each axis
+    start: List[List[int]] = [[], [], []]
     # File read stub
     with open(args[1], "r") as f:
         for line in f:
             # Parse input
-            x, y, z = tuple(map(int, regex.search(r"<x=(-?\d+), y=(-?\d+), z=(-?\d+)>", line.strip()).groups()))
-            start.append(Moon([x, y, z], [0, 0, 0]))
-
-    # Simulate for 1000 cycles
-    moons: List[Moon] = deepcopy(start)
-    for _ in range(1000):
-        for moon in moons:
-            for target in moons:
-                if moon == target:
-                    continue
-                for i in range(3):
-                    if moon.position[i] != target.position[i]:
-                        moon.velocity[i] += 1 if moon.position[i] < target.position[i] else -1
-
-        for moon in moons:
-            moon.position = list(map(operator.add, moon.position, moon.velocity))
-
-    # Get the energy after
-    energy: int = 0
-    for moon in moons:
-        energy += sum(map(abs, moon.position)) * sum(map(abs, moon.velocity))
-    print(energy)
+            for axis, coordinate in zip(start, map(int, line.translate(separators).split())):
+                axis.append(coordinate)
+
+    # Simulate for 1000 cycles, each axis being independent from the others, and the moons starting still
+    positions: List[List[int]] = [axis[:] for axis in start]
+    velocities: List[List[int]] = [[0] * len(axis) for axis in start]
+    for axis_positions, axis_velocities in zip(positions, velocities):
+        for _ in range(1000):
+            simulate(axis_positions, axis_velocities)
+
+    # Get the energy after, as the sum of each moon's potential times its kinetic energy
+    potential: List[int] = [sum(map(abs, position)) for position in zip(*positions)]
+    kinetic: List[int] = [sum(map(abs, velocity)) for velocity in zip(*velocities)]
+    print(sum(map(operator.mul, potential, kinetic)))
 
     # Simulate until a loop is achieved on each axis
-    x_time = test_axis(start, 0)
-    y_time = test_axis(start, 1)
-    z_time = test_axis(start, 2)
+    x_time = test_axis(start[0])
+    y_time = test_axis(start[1])
+    z_time = test_axis(start[2])
     # Get the LCM of these cycles
     print(lcm([x_time, y_time, z_time]))
 
 
-def test_axis(moons: List[Moon], axis: int) -> int:
+def test_axis(start: List[int]) -> int:
     """
     Finds a cycle on a specified axis for the given moons
-    :param moons: List of moons to simulate
-    :param axis: Axis (x, y, or z) to simulate on
+    :param start: Starting positions of the moons on the axis to simulate, the moons start still
     :return: The time before a loop happens in the states for this axis
     """
-    # States set
-    states: Set[Tuple[State, State, State, State]] = set()
+    # Copy the axis to simulate
+    positions: List[int] = start[:]
+    velocities: List[int] = [0] * len(start)
+
+    # The motion is reversible, so the first state to repeat is always the initial one
+    initial_positions: List[int] = positions[:]
+    initial_velocities: List[int] = velocities[:]
     steps: int = 0
     while True:
         # Simulate
-        for moon in moons:
-            for target in moons:
-                if moon == target:
-                    continue
-                if moon.position[axis] != target.position[axis]:
-                    moon.velocity[axis] += 1 if moon.position[axis] < target.position[axis] else -1
-        for moon in moons:
-            moon.position[axis] += moon.velocity[axis]
-
-        # Check if a similar state has been achieved
-        state: Tuple[State, State, State, State]
-        state = moons[0].to_state(axis), moons[1].to_state(axis), moons[2].to_state(axis), moons[3].to_state(axis)
-        # If not, keep simulating
-        if state not in states:
-            states.add(state)
-            steps += 1
-        # Else, return the amount of steps taken to get her
-        else:
+        simulate(positions, velocities)
+        steps += 1
+
+        # Once back to the initial state, return the amount of steps taken to get here
+        if velocities == initial_velocities and positions == initial_positions:
             return steps
 
 
+def simulate(positions: List[int], velocities: List[int]) -> None:
+    """
+    Simulates one step of motion on a single axis for all the moons, in place
+    :param positions: Positions of the moons on the axis
+    :param velocities: Velocities of the moons on the axis
+    """
+
+    # Every moon is pulled by one unit towards each other moon, then moves by its velocity
+    velocities[:] = [v + sum((q > p) - (q < p) for q in positions) for p, v in zip(positions, velocities)]
+    positions[:] = map(operator.add, positions, velocities)
+
+
 def lcm(nums: List[int]) -> int:
     """
     Computes the LCM of the specified numbers
@@ -1,9 +1,8 @@
 import sys
 from tkinter import Tk, Label, StringVar
-from typing import List, Tuple, Final
-from utils import IntcodeComp, Grid, Vector
+from typing import List, Tuple, Optional, Iterator, Callable, Final
+from utils import IntcodeComp, Grid
 from enum import IntEnum
-from threading import Thread
 
 
 class Block(IntEnum):
@@ -28,62 +27,64 @@ class Block(IntEnum):
 Block._as_str = [" ", "▓", "▒", "—", "o"]
 
 # Position indicating it is writing a score and not a position on the game grid
-score_pos: Final[Vector] = Vector(-1, 0)
+score_pos: Final[Tuple[int, int]] = (-1, 0)
 
 
-def play(window: Tk, text: StringVar, score: StringVar, comp: IntcodeComp, grid: Grid[Block], cycles: int = 0) -> None:
+def play(window: Tk, text: StringVar, score: StringVar, comp: IntcodeComp, game: Iterator[Optional[int]],
+         grid: Grid[Block]) -> None:
     """
     Plays a frame of the Block Game in the Intcode VM
     :param window: Game window
     :param text: Grid text
     :param score: Score label
     :param comp: Intcode VM running the game
+    :param game: Running game program, yielding its outputs, or None when waiting for input
     :param grid: Game grid
-    :param cycles: Empty cycles ran
     """
 
-    # Check if there is anything new to display
-    if len(comp.output_buffer) == 0:
-        # If nothing new has been available to display for five frames, assume Game over
-        if cycles == 5:
-            # Print score and return
-            print(score.get())
-            return
-        else:
-            # Wait until next frame, and increment inactivity counter
-            window.after(33, lambda: play(window, text, score, comp, grid, cycles + 1))
-
     # Position of the paddle and ball
-    paddle: Vector = Vector(0, 0)
-    ball: Vector = Vector(0, 0)
+    paddle: Tuple[int, int] = (0, 0)
+    ball: Tuple[int, int] = (0, 0)
+    # Bind the methods used for every output once, outside of the loop
+    next_output: Callable[[], Optional[int]] = game.__next__
+    set_block: Callable[[Tuple[int, int], Block], None] = grid.__setitem__
+
+    # Run the game until it waits for the next input
+    for x in game:
+        if x is None:
+            break
 
-    # Pop out all the info in the output buffer
-    while len(comp.output_buffer) >= 3:
         # Get position to write to
-        pos: Vector = Vector(comp.next_output(), comp.next_output())
+        pos: Tuple[int, int] = (x, next_output())
         # If score position, update score
         if pos == score_pos:
-            score.set(comp.next_output())
+            score.set(next_output())
         else:
             # Else get block type, and keep track if it's the paddle or ball
-            block: Block = Block(comp.next_output())
+            block: Block = Block(next_output())
             if block == Block.PADDLE:
                 paddle = pos
             elif block == Block.BALL:
                 ball = pos
             # Update the grid
-            grid[pos] = block
+            set_block(pos, block)
+    # If the game stopped without waiting for input, it is over
+    else:
+        # Print score and return
+        text.set(str(grid))
+        print(score.get())
+        return
 
     # Update the game label
     text.set(str(grid))
     # Input the new position of the paddle
-    if ball.x != paddle.x:
-        comp.add_input(-1 if ball.x < paddle.x else 1)
+    if ball[0] != paddle[0]:
+        comp.add_input(-1 if ball[0] < paddle[0] else 1)
     else:
         comp.add_input(0)
 
     # Schedule the next update
-    window.after(33, lambda: play(window, text, score, comp, grid))
+    window.after(33, lambda: play(window, text, score, comp, game, grid))
 
 
 def main(args: List[str]) -> None:
@@ -107,9 +108,8 @@ def main(args: List[str]) -> None:
     print(blocks)
 
     # Setup the Intcode VM
-    comp = IntcodeComp("2" + line[1:], threaded=True)
-    thread: Thread = Thread(target=comp.run_program)
-    thread.start()
+    comp = IntcodeComp("2" + line[1:])
+    program: Iterator[Optional[int]] = comp.run_coroutine()
     # Setup the play window
     game: Tk = Tk(screenName="Game")
     game.title("Block Game")
@@ -123,10 +123,9 @@ def main(args: List[str]) -> None:
     # Setup the game grid
     grid: Grid[Block] = Grid(size[0] + 1, size[1] + 1)
     # Setup the update loop
-    game.after(33, lambda: play(game, text, score, comp, grid))
+    game.after(33, lambda: play(game, text, score, comp, program, grid))
     # Run the game
     game.mainloop()
-    thread.join()
 
 
 # Only run if entry point
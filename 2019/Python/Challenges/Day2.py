@@ -18,7 +18,31 @@ def main(args: List[str]) -> None:
 
     # Value to find
     value: int = 19690720
-    # Loop through all possible nouns and verbs
+    # The program's output should be linear in the noun and verb, so find the constant and both coefficients
+    constant: int = comp.run_program(0, 0).code[0]
+    noun_factor: int = comp.run_program(1, 0).code[0] - constant
+    verb_factor: int = comp.run_program(0, 1).code[0] - constant
+    # Loop through all possible nouns, and solve for the verb
+    for noun in range(100):
+        remainder: int = value - constant - (noun_factor * noun)
+        # When the verb has no effect, any verb works as long as the noun alone matches, so take the smallest
+        if verb_factor == 0:
+            if remainder != 0:
+                continue
+            verb: int = 0
+        else:
+            # Only keep the verb if it is a valid whole value
+            verb = remainder // verb_factor
+            if remainder % verb_factor != 0 or not 0 <= verb < 100:
+                continue
+
+        # Run the solved pair to make sure the program really is linear, if it does match we are done
+        if comp.run_program(noun, verb).code[0] == value:
+            print((100 * noun) + verb)
+            return
+        break
+
+    # If the solve failed, loop through all possible nouns and verbs
     for noun in range(100):
         for verb in range(100):
             # Run the program and compare
@@ -1,6 +1,5 @@
 import sys
-from typing import List, Tuple, DefaultDict, Iterator
-from collections import defaultdict
+from typing import List, Tuple, Dict, Iterator, Callable
 
 
 def main(args: List[str]) -> None:
@@ -9,43 +8,78 @@ def main(args: List[str]) -> None:
     :param args: Argument list, should contain the file to load at index 1
     """
 
-    # Create the grid to simulate in
-    grid: DefaultDict[int, DefaultDict[int, int]] = defaultdict(lambda: defaultdict(int))
-    # Set the current closest point out of bounds and shortest trip to something ridiculous
-    closest: int = 999999
-    shortest: int = 999999
-
     # File read stub
     with open(args[1], "r") as f:
-        # Each line of input is a wire, i is an id/index to know which one we're simulating
-        for i, line in enumerate(f):
-            # Starting position and step counter
-            x: int = 0
-            y: int = 0
-            steps: int = 0
-            # Parse all instructions for this wire
-            for dx, dy, length in parse_instructions(line):
-                # For the length of this instruction
-                for _ in range(length):
-                    # Move in the given direction
-                    x += dx
-                    y += dy
-                    steps += 1
-                    curr: int = grid[x][y]
-                    # If first wire, set the current position to the amount of steps if not already done
-                    if i == 0 and curr == 0:
-                        grid[x][y] = steps
-                    # For the second wire, if an amount is set, we're crossing the first pipe
-                    elif i == 1 and curr != 0:
-                        # Calculate the potentially new closest and shortest points
-                        closest = min(closest, abs(x) + abs(y))
-                        shortest = min(shortest, steps + curr)
-
-    # Print the results
+        # Each line of input is a wire, trace the first one, then follow the second one along it
+        first: Dict[Tuple[int, int], int] = trace_wire(f.readline())
+        closest, shortest = cross_wire(f.readline(), first)
+
+    # Print the closest crossing, and the shortest trip to a crossing
     print(closest)
     print(shortest)
 
 
+def trace_wire(instructions: str) -> Dict[Tuple[int, int], int]:
+    """
+    Traces the path of a wire from the origin
+    :param instructions: Instructions describing the wire's path
+    :return: A dictionary of every point the wire goes through, with the amount of steps to first get there
+    """
+
+    # Starting position and step counter
+    path: Dict[Tuple[int, int], int] = {}
+    x: int = 0
+    y: int = 0
+    steps: int = 0
+    # Parse all instructions for this wire
+    for dx, dy, length in parse_instructions(instructions):
+        # For the length of this instruction
+        for _ in range(length):
+            # Move in the given direction
+            x += dx
+            y += dy
+            steps += 1
+            # Set the current position to the amount of steps if not already done
+            path.setdefault((x, y), steps)
+
+    return path
+
+
+def cross_wire(instructions: str, path: Dict[Tuple[int, int], int]) -> Tuple[int, int]:
+    """
+    Follows the path of a wire from the origin, and finds where it crosses a traced wire
+    :param instructions: Instructions describing the wire's path
+    :param path: Every point the traced wire goes through, with the amount of steps to first get there
+    :return: A tuple containing the distance to the closest crossing, then the shortest combined trip to a crossing
+    """
+
+    # Set the current closest point and shortest trip to something ridiculous
+    closest: int = sys.maxsize
+    shortest: int = sys.maxsize
+    # Starting position and step counter
+    x: int = 0
+    y: int = 0
+    steps: int = 0
+    # Only look up the traced path, the points of this wire are never stored
+    lookup: Callable[[Tuple[int, int], int], int] = path.get
+    # Parse all instructions for this wire
+    for dx, dy, length in parse_instructions(instructions):
+        # For the length of this instruction
+        for _ in range(length):
+            # Move in the given direction
+            x += dx
+            y += dy
+            steps += 1
+            # If an amount is set, we're crossing the traced wire
+            curr: int = lookup((x, y), 0)
+            if curr != 0:
+                # Calculate the potentially new closest and shortest points
+                closest = min(closest, abs(x) + abs(y))
+                shortest = min(shortest, steps + curr)
+
+    return closest, shortest
+
+
 def parse_instructions(instructions: str) -> Iterator[Tuple[int, int, int]]:
     # Splits the line into individual instructions
     for instruction in instructions.split(","):
@@ -1,6 +1,5 @@
 import sys
-from typing import List, Pattern
-import re as regex
+from typing import List
 
 
 def main(args: List[str]) -> None:
@@ -16,19 +15,40 @@ def main(args: List[str]) -> None:
         b: int
         a, b = tuple(map(int, f.readline().split("-")))
 
-    # This pattern matches a string made of digits in increasing order
-    increasing: Pattern = regex.compile(r"^1*2*3*4*5*6*7*8*9*$")
-    # This pattern matches any digit repeated at least once
-    multiple: Pattern = regex.compile(r"(\d)\1")
-    # Start by finding all the numbers matching these requirements
-    possible: List[str] = list(filter(lambda n: increasing.match(n) and multiple.search(n), map(str, range(a, b + 1))))
-    # First answer is the length of that list+
-    print(len(possible))
-
-    # This pattern matches if the digit is only repeated twice
-    pair: Pattern = regex.compile(r"(?:^|(.)(?!\1))(\d)\2(?!\2)")
-    # Count how many satisfy this new condition
-    print(sum(1 for n in possible if pair.search(n)))
+    repeated: int = 0
+    paired: int = 0
+    n: int = a
+    while n <= b:
+        digits: str = str(n)
+        # Scan the digits once, keeping track of the length of the current run of equal digits
+        run: int = 1
+        repeat: bool = False
+        pair: bool = False
+        for i in range(1, len(digits)):
+            if digits[i] < digits[i - 1]:
+                # Decreasing digit, skip straight to the next number with its digits in increasing order
+                n = int(digits[:i] + (digits[i - 1] * (len(digits) - i)))
+                break
+            if digits[i] == digits[i - 1]:
+                run += 1
+            else:
+                # End of a run, check if it was repeated, and if it was exactly a pair
+                repeat = repeat or run >= 2
+                pair = pair or run == 2
+                run = 1
+        else:
+            # All digits are increasing, check the last run then count the number
+            if repeat or run >= 2:
+                repeated += 1
+                if pair or run == 2:
+                    paired += 1
+            n += 1
+
+    # First answer is the amount of numbers with a repeated digit
+    print(repeated)
+
+    # Second answer is the amount of numbers with a digit repeated exactly twice
+    print(paired)
 
 
 # Only run if entry point
@@ -1,8 +1,61 @@
 import sys
-from typing import List, Deque, Optional
+from typing import List, Tuple, FrozenSet, Optional, Generator
 from itertools import permutations
-from utils import IntcodeComp
-from threading import Thread
+from utils import IntcodeComp, State
+
+
+def series_thrust(comp: IntcodeComp, phases: FrozenSet[int], signal: int = 0) -> int:
+    """
+    Finds the best thrust from running the amplifiers in series, searching the phase orders depth first so that
+    amplifiers sharing the same phase prefix are only ran once
+    :param comp: Intcode Computer running the amplifier program, with it's input and output buffers linked
+    :param phases: Phases not yet used by the previous amplifiers
+    :param signal: Signal input into the next amplifier
+    :return: The best thrust output by the last amplifier
+    """
+
+    # Once all amplifiers have ran, the signal is the thrust
+    if not phases:
+        return signal
+
+    thrust: int = 0
+    for phase in phases:
+        # Append phase and signal, then run the amplifier
+        comp.input_buffer.append(phase)
+        comp.input_buffer.append(signal)
+        output: int = comp.run_program().output.pop()
+        # Then search through all the remaining phases with this output
+        thrust = max(thrust, series_thrust(comp, phases - {phase}, output))
+
+    return thrust
+
+
+def feedback_thrust(amplifiers: List[IntcodeComp], perm: Tuple[int, ...]) -> int:
+    """
+    Runs the amplifiers in a feedback loop with the given phases, and gets the resulting thrust
+    :param amplifiers: Intcode Computers running the amplifier program
+    :param perm: Phase of each amplifier
+    :return: The last thrust output by the last amplifier
+    """
+
+    # Start all the amplifiers as coroutines, and input their phase number
+    programs: List[Generator[Optional[int], Optional[int], State]] = []
+    for amplifier, phase in zip(amplifiers, perm):
+        amplifier.input_buffer.clear()
+        program: Generator[Optional[int], Optional[int], State] = amplifier.run_coroutine()
+        next(program)
+        program.send(phase)
+        programs.append(program)
+
+    # Pass the signal around the loop, each amplifier running until it outputs, until one halts
+    signal: int = 0
+    try:
+        while True:
+            for program in programs:
+                signal = program.send(signal)
+    except StopIteration:
+        # Final thrust is the last signal output by the last amplifier
+        return signal
 
 
 def main(args: List[str]) -> None:
@@ -20,54 +73,14 @@ def main(args: List[str]) -> None:
     comp: IntcodeComp = IntcodeComp(line)
     comp.input_buffer = comp.output_buffer
 
-    thrust: int = 0
-    # For all phase permutations
-    for perm in permutations([0, 1, 2, 3, 4]):
-        out: Optional[Deque[int]] = None
-        # Add original input
-        comp.input_buffer.append(0)
-        # For each amplifier
-        for phase in perm:
-            # Append phase and run
-            comp.input_buffer.appendleft(phase)
-            out = comp.run_program().output
-
-        # Final thrust is in the output buffer
-        thrust = max(thrust, out.pop())
-
-    # Print the max thrust
-    print(thrust)
-
-    # Reset thrust and create the five amplifiers
-    thrust = 0
-    amplifiers: List[IntcodeComp] = [IntcodeComp(line, threaded=True) for _ in range(5)]
-    # Link all input and output buffers circularly
-    for i in range(5):
-        amplifiers[i].input_buffer = amplifiers[i - 1].output_buffer
-
-    # For all phase permutations
-    for perm in permutations([5, 6, 7, 8, 9]):
-        # Input the phase number
-        for i in range(5):
-            amplifiers[i].add_input(perm[i])
-
-        # Add original input to the first
-        amplifiers[0].add_input(0)
-
-        # Create all the amplifier threads
-        threads: List[Thread] = [Thread(target=amplifier.run_program) for amplifier in amplifiers]
-
-        # Start all threads, then wait for all threads
-        for thread in threads:
-            thread.start()
-        for thread in threads:
-            thread.join()
-
-        # Final thrust is in the last amplifier's output buffer
-        thrust = max(thrust, amplifiers[-1].next_output())
-
-    # Print the max thrust
-    print(thrust)
+    # Print the max thrust over all phase orders
+    print(series_thrust(comp, frozenset(range(5))))
+
+    # Create the five amplifiers
+    amplifiers: List[IntcodeComp] = [IntcodeComp(line) for _ in range(5)]
+
+    # Print the max thrust over all phase permutations
+    print(max(feedback_thrust(amplifiers, perm) for perm in permutations([5, 6, 7, 8, 9])))
 
 
 # Only run if entry point
@@ -1,5 +1,9 @@
 import sys
-from typing import List, Final
+from typing import List, Dict, Final
+
+
+# Colour of each pixel value, transparent pixels are left blank
+colours: Final[Dict[int, str]] = str.maketrans({"0": "░", "1": "▓", "2": " "})
 
 
 def main(args: List[str]) -> None:
@@ -20,34 +24,17 @@ def main(args: List[str]) -> None:
     # Separate the data into layers
     layers: List[str] = [data[i:i + stride] for i in range(0, len(data), stride)]
 
-    # Find the layer with the least zeroes
-    zeroes: int = stride
-    h: int = 0
-    for layer in layers:
-        z = layer.count("0")
-        if z < zeroes:
-            # Calculate the hash of 1's and 2's
-            zeroes = z
-            h = layer.count("1") * layer.count("2")
-
-    print(h)
-
-    # Create the array for the final image
-    image: List[str] = ["2"] * stride
-    for i in range(stride):
-        # Check through the layers sequentially
-        for layer in layers:
-            # If the pixel is not transparent, write it to the layer
-            if layer[i] < "2":
-                image[i] = layer[i]
-                break
+    # Find the layer with the least zeroes, and calculate the hash of 1's and 2's
+    layer: str = min(layers, key=lambda l: l.count("0"))
+    print(layer.count("1") * layer.count("2"))
+
+    # Create the final image, each pixel being the first non transparent one through all the layers
+    image: str = "".join((pixel.lstrip("2") or "2")[0] for pixel in map("".join, zip(*layers)))
 
     # Replace all numerical values by colours
-    image = ["░" if s == "0" else s for s in image]
-    image = ["▓" if s == "1" else " " for s in image]
+    image = image.translate(colours)
     # Join the image into the right format
-    image = ["".join(image[i:i + width]) for i in range(0, len(image), width)]
-    print("\n".join(image))
+    print("\n".join(image[i:i + width] for i in range(0, len(image), width)))
 
 
 # Only run if entry point
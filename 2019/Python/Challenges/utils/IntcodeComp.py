@@ -1,51 +1,25 @@
 from __future__ import annotations
-from typing import Tuple, List, Deque, Dict, NamedTuple, Callable, Optional, Final
+from typing import Tuple, List, Deque, Union, Dict, NamedTuple, Callable, Optional, Generator, Final
 from collections import deque
-from enum import Enum, IntEnum
-from time import sleep
+from itertools import product
+from queue import SimpleQueue
 
 
-class Parameter(IntEnum):
-    """
-    Input mode flags for the IntcodeComp
-    """
-
-    # region Enum members
-    FIRST  = 1
-    SECOND = 2
-    THIRD = 3
-    # endregion
-
-
-class ParamMode(Enum):
-    """
-    Intcode Parameter Modes
-    """
-
-    # region Enum members
-    ABSOLUTE = 0
-    IMMEDIATE = 1
-    RELATIVE = 2
-    # endregion
-
+# Intcode opcodes, kept as plain integers so they can directly index the operations table
+ADD: Final[int] = 1
+MUL: Final[int] = 2
+INP: Final[int] = 3
+OUT: Final[int] = 4
+JIT: Final[int] = 5
+JIF: Final[int] = 6
+TLT: Final[int] = 7
+TEQ: Final[int] = 8
+REF: Final[int] = 9
+HLT: Final[int] = 99
 
-class Opcode(Enum):
-    """
-    Opcodes for the IntcodeComp
-    """
 
-    # region Enum members
-    ADD = 1
-    MUL = 2
-    INP = 3
-    OUT = 4
-    JIT = 5
-    JIF = 6
-    TLT = 7
-    TEQ = 8
-    REF = 9
-    HLT = 99
-    # endregion
+# IntcodeComp buffer, a blocking queue when threaded
+Buffer = Union[Deque[int], SimpleQueue]
 
 
 class State(NamedTuple):
@@ -53,7 +27,7 @@ class State(NamedTuple):
     IntcodeComp state
     """
     code: List[int]
-    output: Deque[int]
+    output: Buffer
 
 
 class IntcodeComp:
@@ -63,231 +37,238 @@ class IntcodeComp:
 
     # region Static methods
     @staticmethod
-    def _decode_instruction(instruction: int) -> Tuple[Opcode, str]:
-        """
-        Turns an intcode instruction into it's corresponding Opcode and parameter modes string
-        :param instruction: Intcode instruction to decode
+    def _split_modes(modes: int) -> Tuple[int, int, int]:
         """
-
-        instruction = f"{instruction:05}"
-        return Opcode(int(instruction[-2:])), instruction[0:-2]
-
-    @staticmethod
-    def _get_param(prog: List[int], ip: int, modes: str, param: Parameter, ref: int) -> int:
+        Splits integer parameter modes into the mode of each parameter (0 position, 1 immediate, 2 relative)
+        :param modes: Parameter modes to split
+        :return: A tuple containing the mode of the first, second, and third parameter
         """
-        Gets the parameter in either immediate mode, relative mode, or address mode
-        :param prog: Intcode program to get the parameter from
-        :param ip: Current instruction pointer
-        :param modes: Current parameter modes for this Opcode
-        :param param: Current parameter of the instruction
-        :param ref: Reference base for relative instructions
-        :return: The value of the parameter, accounting for the correct input mode
-        """
-
-        # Instruction parameter
-        x: int = prog[ip + param]
-        # Default to absolute if parameter modes are not provided
-        if modes is None:
-            return prog[x]
-        # Use the correct parameter mode
-        mode: ParamMode = ParamMode(int(modes[-param]))
-        if mode == mode.ABSOLUTE:
-            return prog[x]
-        elif mode == mode.IMMEDIATE:
-            return x
-        elif mode == mode.RELATIVE:
-            return prog[x + ref]
-        else:
-            raise ValueError("Invalid ParameterMode detected")
 
-    @staticmethod
-    def _get_register(prog: List[int], ip: int, modes: str, param: Parameter, ref: int) -> int:
-        """
-                Gets the register address in either relative mode or address mode
-                :param prog: Intcode program to get the parameter from
-                :param ip: Current instruction pointer
-                :param modes: Current parameter modes for this Opcode
-                :param param: Current parameter of the instruction
-                :param ref: Reference base for relative instructions
-                :return: The value of the parameter, accounting for the correct input mode
-                """
-
-        # Instruction parameter
-        x: int = prog[ip + param]
-        # Default to absolute if parameter modes are not provided
-        if modes is None:
-            return x
-        # Use the correct parameter mode
-        mode: ParamMode = ParamMode(int(modes[-param]))
-        if mode == mode.ABSOLUTE:
-            return x
-        elif mode == mode.IMMEDIATE:
-            raise ValueError("Immediate mode not supported for writes")
-        elif mode == mode.RELATIVE:
-            return x + ref
-        else:
-            raise ValueError("Invalid ParameterMode detected")
+        return modes % 10, (modes // 10) % 10, modes // 100
 
     @staticmethod
-    def _add(prog: List[int], ip: int, comp: IntcodeComp, modes: Optional[str] = None) -> int:
+    def _add(modes: int) -> Operation:
         """
         Add Opcode operation
-        :param prog: Program memory
-        :param ip: Current instruction pointer
-        :param comp: IntcodeComp this operation is executed from
-        :param modes: Input modes
-        :return: The new instruction pointer after execution
+        :param modes: Input modes to specialize the operation for
+        :return: The operation, taking the program memory, current instruction pointer, and the IntcodeComp it is
+                 executed from, and returning the new instruction pointer after execution
         """
 
-        a = IntcodeComp._get_param(prog, ip, modes, Parameter.FIRST, comp._reference)
-        b = IntcodeComp._get_param(prog, ip, modes, Parameter.SECOND, comp._reference)
-        c = IntcodeComp._get_register(prog, ip, modes, Parameter.THIRD, comp._reference)
+        first, second, third = IntcodeComp._split_modes(modes)
+
+        def add(prog: List[int], ip: int, comp: IntcodeComp) -> int:
+            # Fetch the parameters according to their mode
+            x: int = prog[ip + 1]
+            a: int = prog[x] if first == 0 else x if first == 1 else prog[x + comp._reference]
+            x = prog[ip + 2]
+            b: int = prog[x] if second == 0 else x if second == 1 else prog[x + comp._reference]
+            c: int = prog[ip + 3] if third != 2 else prog[ip + 3] + comp._reference
 
-        prog[c] = a + b
-        return ip + 4
+            prog[c] = a + b
+            return ip + 4
+        return add
 
     @staticmethod
-    def _mul(prog: List[int], ip: int, comp: IntcodeComp, modes: Optional[str] = None) -> int:
+    def _mul(modes: int) -> Operation:
         """
         Multiply Opcode operation
-        :param prog: Program memory
-        :param ip: Current instruction pointer
-        :param comp: IntcodeComp this operation is executed from
-        :param modes: Input modes
-        :return: The new instruction pointer after execution
+        :param modes: Input modes to specialize the operation for
+        :return: The operation, taking the program memory, current instruction pointer, and the IntcodeComp it is
+                 executed from, and returning the new instruction pointer after execution
         """
-        a = IntcodeComp._get_param(prog, ip, modes, Parameter.FIRST, comp._reference)
-        b = IntcodeComp._get_param(prog, ip, modes, Parameter.SECOND, comp._reference)
-        c = IntcodeComp._get_register(prog, ip, modes, Parameter.THIRD, comp._reference)
 
-        prog[c] = a * b
-        return ip + 4
+        first, second, third = IntcodeComp._split_modes(modes)
+
+        def mul(prog: List[int], ip: int, comp: IntcodeComp) -> int:
+            # Fetch the parameters according to their mode
+            x: int = prog[ip + 1]
+            a: int = prog[x] if first == 0 else x if first == 1 else prog[x + comp._reference]
+            x = prog[ip + 2]
+            b: int = prog[x] if second == 0 else x if second == 1 else prog[x + comp._reference]
+            c: int = prog[ip + 3] if third != 2 else prog[ip + 3] + comp._reference
+
+            prog[c] = a * b
+            return ip + 4
+        return mul
 
     @staticmethod
-    def _inp(prog: List[int], ip: int, comp: IntcodeComp, modes: Optional[str] = None) -> int:
+    def _inp(modes: int) -> Operation:
         """
         Input Opcode operation
-        :param prog: Program memory
-        :param ip: Current instruction pointer
-        :param comp: IntcodeComp this operation is executed from
-        :param modes: Input modes
-        :return: The new instruction pointer after execution
-        """
-        if len(comp._input_buffer) == 0:
-            # If nothing is in the input buffer and in a threaded environment, busy wait until something is produced
-            if comp._threaded:
-                while len(comp._input_buffer) == 0:
-                    sleep(1E-3)  # 1ms
-            # Else throw
-            else:
-                raise ValueError("Input buffer empty")
+        :param modes: Input modes to specialize the operation for
+        :return: The operation, taking the program memory, current instruction pointer, and the IntcodeComp it is
+                 executed from, and returning the new instruction pointer after execution
+        """
+
+        first: int = IntcodeComp._split_modes(modes)[0]
 
-        # Pop the input buffer
-        a = IntcodeComp._get_register(prog, ip, modes, Parameter.FIRST, comp._reference)
-        inp = comp._input_buffer.popleft()
+        def inp(prog: List[int], ip: int, comp: IntcodeComp) -> int:
+            # Get the address to write to
+            a: int = prog[ip + 1] if first != 2 else prog[ip + 1] + comp._reference
+            # Read from the input buffer, in a threaded environment this blocks until something is produced
+            try:
+                value: int = comp._read_input()
+            # Else throw if nothing is in the input buffer
+            except IndexError:
+                raise ValueError("Input buffer empty")
 
-        prog[a] = inp
-        return ip + 2
+            prog[a] = value
+            return ip + 2
+        return inp
 
     @staticmethod
-    def _out(prog: List[int], ip: int, comp: IntcodeComp, modes: Optional[str] = None) -> int:
+    def _out(modes: int) -> Operation:
         """
         Output Opcode operation
-        :param prog: Program memory
-        :param ip: Current instruction pointer
-        :param comp: IntcodeComp this operation is executed from
-        :param modes: Input modes
-        :return: The new instruction pointer after execution
+        :param modes: Input modes to specialize the operation for
+        :return: The operation, taking the program memory, current instruction pointer, and the IntcodeComp it is
+                 executed from, and returning the new instruction pointer after execution
         """
-        a = IntcodeComp._get_param(prog, ip, modes, Parameter.FIRST, comp._reference)
 
-        # Add to the output buffer
-        comp._output_buffer.append(a)
-        return ip + 2
+        first: int = IntcodeComp._split_modes(modes)[0]
+
+        def out(prog: List[int], ip: int, comp: IntcodeComp) -> int:
+            # Fetch the parameter according to it's mode
+            x: int = prog[ip + 1]
+            a: int = prog[x] if first == 0 else x if first == 1 else prog[x + comp._reference]
+
+            # Add to the output buffer, waking up any threaded IntcodeComp waiting on it
+            comp._write_output(a)
+            return ip + 2
+        return out
 
     @staticmethod
-    def _jit(prog: List[int], ip: int, comp: IntcodeComp, modes: Optional[str] = None) -> int:
+    def _jit(modes: int) -> Operation:
         """
         Jump-If-True Opcode operation
-        :param prog: Program memory
-        :param ip: Current instruction pointer
-        :param comp: IntcodeComp this operation is executed from
-        :param modes: Input modes
-        :return: The new instruction pointer after execution
+        :param modes: Input modes to specialize the operation for
+        :return: The operation, taking the program memory, current instruction pointer, and the IntcodeComp it is
+                 executed from, and returning the new instruction pointer after execution
         """
-        a = IntcodeComp._get_param(prog, ip, modes, Parameter.FIRST, comp._reference)
-        b = IntcodeComp._get_param(prog, ip, modes, Parameter.SECOND, comp._reference)
 
-        return b if a != 0 else ip + 3
+        first, second, _ = IntcodeComp._split_modes(modes)
+
+        def jit(prog: List[int], ip: int, comp: IntcodeComp) -> int:
+            # Fetch the parameters according to their mode
+            x: int = prog[ip + 1]
+            a: int = prog[x] if first == 0 else x if first == 1 else prog[x + comp._reference]
+            x = prog[ip + 2]
+            b: int = prog[x] if second == 0 else x if second == 1 else prog[x + comp._reference]
+
+            return b if a != 0 else ip + 3
+        return jit
 
     @staticmethod
-    def _jif(prog: List[int], ip: int, comp: IntcodeComp, modes: Optional[str] = None) -> int:
+    def _jif(modes: int) -> Operation:
         """
         Jump-If-False Opcode operation
-        :param prog: Program memory
-        :param ip: Current instruction pointer
-        :param comp: IntcodeComp this operation is executed from
-        :param modes: Input modes
-        :return: The new instruction pointer after execution
+        :param modes: Input modes to specialize the operation for
+        :return: The operation, taking the program memory, current instruction pointer, and the IntcodeComp it is
+                 executed from, and returning the new instruction pointer after execution
         """
-        a = IntcodeComp._get_param(prog, ip, modes, Parameter.FIRST, comp._reference)
-        b = IntcodeComp._get_param(prog, ip, modes, Parameter.SECOND, comp._reference)
 
-        return b if a == 0 else ip + 3
+        first, second, _ = IntcodeComp._split_modes(modes)
+
+        def jif(prog: List[int], ip: int, comp: IntcodeComp) -> int:
+            # Fetch the parameters according to their mode
+            x: int = prog[ip + 1]
+            a: int = prog[x] if first == 0 else x if first == 1 else prog[x + comp._reference]
+            x = prog[ip + 2]
+            b: int = prog[x] if second == 0 else x if second == 1 else prog[x + comp._reference]
+
+            return b if a == 0 else ip + 3
+        return jif
 
     @staticmethod
-    def _tlt(prog: List[int], ip: int, comp: IntcodeComp, modes: Optional[str] = None) -> int:
+    def _tlt(modes: int) -> Operation:
         """
         Test-Less-Than Opcode operation
-        :param prog: Program memory
-        :param ip: Current instruction pointer
-        :param comp: IntcodeComp this operation is executed from
-        :param modes: Input modes
-        :return: The new instruction pointer after execution
+        :param modes: Input modes to specialize the operation for
+        :return: The operation, taking the program memory, current instruction pointer, and the IntcodeComp it is
+                 executed from, and returning the new instruction pointer after execution
         """
-        a = IntcodeComp._get_param(prog, ip, modes, Parameter.FIRST, comp._reference)
-        b = IntcodeComp._get_param(prog, ip, modes, Parameter.SECOND, comp._reference)
-        c = IntcodeComp._get_register(prog, ip, modes, Parameter.THIRD, comp._reference)
 
-        prog[c] = 1 if a < b else 0
-        return ip + 4
+        first, second, third = IntcodeComp._split_modes(modes)
+
+        def tlt(prog: List[int], ip: int, comp: IntcodeComp) -> int:
+            # Fetch the parameters according to their mode
+            x: int = prog[ip + 1]
+            a: int = prog[x] if first == 0 else x if first == 1 else prog[x + comp._reference]
+            x = prog[ip + 2]
+            b: int = prog[x] if second == 0 else x if second == 1 else prog[x + comp._reference]
+            c: int = prog[ip + 3] if third != 2 else prog[ip + 3] + comp._reference
+
+            prog[c] = 1 if a < b else 0
+            return ip + 4
+        return tlt
 
     @staticmethod
-    def _teq(prog: List[int], ip: int, comp: IntcodeComp, modes: Optional[str] = None) -> int:
+    def _teq(modes: int) -> Operation:
         """
         Test-Equals Opcode operation
-        :param prog: Program memory
-        :param ip: Current instruction pointer
-        :param comp: IntcodeComp this operation is executed from
-        :param modes: Input modes
-        :return: The new instruction pointer after execution
+        :param modes: Input modes to specialize the operation for
+        :return: The operation, taking the program memory, current instruction pointer, and the IntcodeComp it is
+                 executed from, and returning the new instruction pointer after execution
         """
-        a = IntcodeComp._get_param(prog, ip, modes, Parameter.FIRST, comp._reference)
-        b = IntcodeComp._get_param(prog, ip, modes, Parameter.SECOND, comp._reference)
-        c = IntcodeComp._get_register(prog, ip, modes, Parameter.THIRD, comp._reference)
 
-        prog[c] = 1 if a == b else 0
-        return ip + 4
+        first, second, third = IntcodeComp._split_modes(modes)
+
+        def teq(prog: List[int], ip: int, comp: IntcodeComp) -> int:
+            # Fetch the parameters according to their mode
+            x: int = prog[ip + 1]
+            a: int = prog[x] if first == 0 else x if first == 1 else prog[x + comp._reference]
+            x = prog[ip + 2]
+            b: int = prog[x] if second == 0 else x if second == 1 else prog[x + comp._reference]
+            c: int = prog[ip + 3] if third != 2 else prog[ip + 3] + comp._reference
+
+            prog[c] = 1 if a == b else 0
+            return ip + 4
+        return teq
 
     @staticmethod
-    def _ref(prog: List[int], ip: int, comp: IntcodeComp, modes: Optional[str] = None) -> int:
+    def _ref(modes: int) -> Operation:
         """
         Reference-Adjust Opcode operation
+        :param modes: Input modes to specialize the operation for
+        :return: The operation, taking the program memory, current instruction pointer, and the IntcodeComp it is
+                 executed from, and returning the new instruction pointer after execution
+        """
+
+        first: int = IntcodeComp._split_modes(modes)[0]
+
+        def ref(prog: List[int], ip: int, comp: IntcodeComp) -> int:
+            # Fetch the parameter according to it's mode
+            x: int = prog[ip + 1]
+            comp._reference += prog[x] if first == 0 else x if first == 1 else prog[x + comp._reference]
+            return ip + 2
+        return ref
+
+    @staticmethod
+    def _hlt(modes: int) -> Operation:
+        """
+        Halt Opcode operation
+        :param modes: Input modes to specialize the operation for
+        :return: The operation, which returns a negative instruction pointer, signaling the program to stop
+        """
+
+        return lambda prog, ip, comp: -1
+
+    @staticmethod
+    def _invalid(prog: List[int], ip: int, comp: IntcodeComp) -> int:
+        """
+        Operation for any instruction which is not part of the instruction set
         :param prog: Program memory
         :param ip: Current instruction pointer
         :param comp: IntcodeComp this operation is executed from
-        :param modes: Input modes
-        :return: The new instruction pointer after execution
         """
-        a = IntcodeComp._get_param(prog, ip, modes, Parameter.FIRST, comp._reference)
-        comp._reference += a
 
-        return ip + 2
+        raise ValueError("Invalid Opcode detected")
     # endregion
 
     # region Properties
     @property
-    def input_buffer(self) -> Deque[int]:
+    def input_buffer(self) -> Buffer:
         """
         This Intcode Computer's input buffer
         :return: The input buffer
@@ -295,15 +276,16 @@ class IntcodeComp:
         return self._input_buffer
 
     @input_buffer.setter
-    def input_buffer(self, value: Deque[int]) -> None:
+    def input_buffer(self, value: Buffer) -> None:
         """
         Sets this Intcode Computer's input buffer
         :param value: New input buffer
         """
         self._input_buffer = value
+        self._bind_buffers()
 
     @property
-    def output_buffer(self) -> Deque[int]:
+    def output_buffer(self) -> Buffer:
         """
         This Intcode Computer's output buffer
         :return: The output buffer
@@ -311,12 +293,13 @@ class IntcodeComp:
         return self._output_buffer
 
     @output_buffer.setter
-    def output_buffer(self, value: Deque[int]) -> None:
+    def output_buffer(self, value: Buffer) -> None:
         """
         Sets this Intcode Computer's output buffer
         :param value: New output buffer
         """
         self._output_buffer = value
+        self._bind_buffers()
     # endregion
 
     # region Constructor
@@ -325,34 +308,52 @@ class IntcodeComp:
         Creates a new IntcodeComputer for the given program
         :param code: Code that the computer has to run
         :param uses_modes: If input modes are active for this computer
-        :param threaded: If the IntcodeComp will be ran in it's own thread or not
+        :param threaded: If the IntcodeComp will be ran in it's own thread or not, threaded IntcodeComps use blocking
+                         queues as buffers instead of deques
         """
 
         # Setup the code into the list it needs to be
         self._program: List[int] = list(map(int, code.split(","))) + ([0] * 2000)  # Additional memory
         self._modes: bool = uses_modes
         self._threaded: bool = threaded
-        self._input_buffer: Deque[int] = deque()
-        self._output_buffer: Deque[int] = deque()
+        self._input_buffer: Buffer = SimpleQueue() if threaded else deque()
+        self._output_buffer: Buffer = SimpleQueue() if threaded else deque()
+        self._read_input: Callable[[], int]
+        self._write_output: Callable[[int], None]
+        self._bind_buffers()
         self._reference: int = 0
     # endregion
 
     # region Methods
+    def _bind_buffers(self) -> None:
+        """
+        Binds the buffer read and write methods used by the operations, so they are not looked up on every access
+        """
+
+        if self._threaded:
+            self._read_input = self._input_buffer.get
+            self._write_output = self._output_buffer.put
+        else:
+            self._read_input = self._input_buffer.popleft
+            self._write_output = self._output_buffer.append
+
     def add_input(self, *args: int) -> None:
         """
         Adds the all the provided inputs in order to the IntcodeComp's input buffer
         :param args: Values to add to the input buffer
         """
 
+        # Add to the input buffer, waking up this IntcodeComp if it is waiting on it
+        add: Callable[[int], None] = self._input_buffer.put if self._threaded else self._input_buffer.append
         for value in args:
-            self._input_buffer.append(value)
+            add(value)
 
     def next_output(self) -> int:
         """
         Returns the next value in this IntcodeComp's output buffer
         :return: The next value in the output buffer
         """
-        return self._output_buffer.popleft()
+        return self._output_buffer.get() if self._threaded else self._output_buffer.popleft()
 
     def run_program(self, noun: Optional[int] = None, verb: Optional[int] = None) -> State:
         """
@@ -373,19 +374,23 @@ class IntcodeComp:
         if self._modes:
             return self._run_program_modes(prog)
 
-        # Set the Instruction Pointer and the starting Opcode
+        # Set the Instruction Pointer and the starting instruction
         ip: int = 0
-        opcode: Opcode = Opcode(prog[ip])
-
-        # Run forever
-        while opcode is not Opcode.HLT:
-            # Get the a register value, b register value, and c register value
-            try:
-                ip = _operations[opcode](prog, ip, self)
-            except KeyError:
-                raise ValueError("Invalid Opcode detected")
+        instruction: int = prog[ip]
+
+        # Run until HLT (99), comparing raw integers against literal opcodes
+        while instruction != 99:
+            # ADD and MUL share their operand fetch, and only need a single compare to pick the operation
+            if 0 < instruction <= 2:
+                a: int = prog[prog[ip + 1]]
+                b: int = prog[prog[ip + 2]]
+                prog[prog[ip + 3]] = a + b if instruction == 1 else a * b
+                ip += 4
+            # Any other operation goes through the generic handlers
+            else:
+                ip = (_operations[instruction] if 0 <= instruction < _size else IntcodeComp._invalid)(prog, ip, self)
 
-            opcode = Opcode(prog[ip])
+            instruction = prog[ip]
 
         # Return output of the program
         return State(prog, self._output_buffer)
@@ -397,21 +402,57 @@ class IntcodeComp:
         :return: A tuple containing the final state of the program's memory, as well as the final output buffer
         """
 
-        # Set the Instruction Pointer and the starting Opcode
+        # Set the Instruction Pointer, and keep the operations table as a local for the hot loop
         ip: int = 0
-        opcode: Opcode
-        modes: str
-        opcode, modes = IntcodeComp._decode_instruction(prog[ip])
+        operations: List[Operation] = _operations
+        size: int = _size
+        invalid: Operation = IntcodeComp._invalid
 
-        # Run forever
-        while opcode is not Opcode.HLT:
-            # Get the a register value, b register value, and c register value
-            try:
-                ip = _operations[opcode](prog, ip, self, modes)
-            except KeyError:
-                raise ValueError("Invalid Opcode detected")
+        # Run until HLT sets a negative Instruction Pointer
+        while ip >= 0:
+            # Dispatch directly from the raw instruction to the operation specialized for it's modes, or to the
+            # invalid operation for any instruction outside of the table
+            instruction: int = prog[ip]
+            ip = (operations[instruction] if 0 <= instruction < size else invalid)(prog, ip, self)
+
+        # Return output of the program
+        return State(prog, self._output_buffer)
+
+    def run_coroutine(self) -> Generator[Optional[int], Optional[int], State]:
+        """
+        Runs the Intcode program associated to this computer as a coroutine, handing control back to the caller
+        every time a value is output, or when an input is needed but the input buffer is empty.
+        Any value sent into the coroutine is added to the input buffer before the program resumes.
+        The IntcodeComp must not be threaded to run as a coroutine.
+        :return: A generator yielding each output value, or None when the program is waiting for input
+        """
+
+        # Make sure we make a copy of the program first
+        prog: List[int] = self._program.copy()
+        self._reference = 0
+
+        # Set the Instruction Pointer
+        ip: int = 0
 
-            opcode, modes = IntcodeComp._decode_instruction(prog[ip])
+        # Run until HLT sets a negative Instruction Pointer
+        while ip >= 0:
+            instruction: int = prog[ip]
+            opcode: int = instruction % 100
+            # If no input (INP, 3) is available, wait until the caller provides some
+            if opcode == 3 and len(self._input_buffer) == 0:
+                value: Optional[int] = yield None
+                if value is not None:
+                    self._input_buffer.append(value)
+                continue
+
+            # Dispatch directly from the raw instruction to the operation specialized for it's modes
+            ip = (_operations[instruction] if 0 <= instruction < _size else IntcodeComp._invalid)(prog, ip, self)
+
+            # Hand the output (OUT, 4) directly to the caller
+            if opcode == 4:
+                value = yield self._output_buffer.pop()
+                if value is not None:
+                    self._input_buffer.append(value)
 
         # Return output of the program
         return State(prog, self._output_buffer)
@@ -419,17 +460,30 @@ class IntcodeComp:
 
 
 # Operation function signature
-Operation = Callable[[List[int], int, IntcodeComp, Optional[str]], int]
-# Opcode/Operations map
-_operations: Final[Dict[Opcode, Operation]] = {
-    Opcode.ADD: IntcodeComp._add,
-    Opcode.MUL: IntcodeComp._mul,
-    Opcode.INP: IntcodeComp._inp,
-    Opcode.OUT: IntcodeComp._out,
-    Opcode.JIT: IntcodeComp._jit,
-    Opcode.JIF: IntcodeComp._jif,
-    Opcode.TLT: IntcodeComp._tlt,
-    Opcode.TEQ: IntcodeComp._teq,
-    Opcode.REF: IntcodeComp._ref,
-    Opcode.HLT: lambda _, ip, __, ___: ip
+Operation = Callable[[List[int], int, IntcodeComp], int]
+# Opcode to specialized Operation factory, parameter count, and if the last parameter is written to map
+_factories: Final[Dict[int, Tuple[Callable[[int], Operation], int, bool]]] = {
+    ADD: (IntcodeComp._add, 3, True),
+    MUL: (IntcodeComp._mul, 3, True),
+    INP: (IntcodeComp._inp, 1, True),
+    OUT: (IntcodeComp._out, 1, False),
+    JIT: (IntcodeComp._jit, 2, False),
+    JIF: (IntcodeComp._jif, 2, False),
+    TLT: (IntcodeComp._tlt, 3, True),
+    TEQ: (IntcodeComp._teq, 3, True),
+    REF: (IntcodeComp._ref, 1, False),
+    HLT: (IntcodeComp._hlt, 0, False)
 }
+# Size of the operations table, one past the highest possible instruction
+_size: Final[int] = 22300
+# Operations table, indexed directly by the raw instruction, holding an operation specialized for every valid
+# combination of opcode and parameter modes, where every other instruction is invalid
+_operations: Final[List[Operation]] = [IntcodeComp._invalid] * _size
+for _opcode, (_factory, _count, _writes) in _factories.items():
+    # Parameters that are written to cannot be in immediate mode
+    _ranges: List[Tuple[int, ...]] = [(0, 1, 2)] * _count
+    if _writes:
+        _ranges[-1] = (0, 2)
+    for _modes in product(*_ranges):
+        _mode: int = sum(mode * (10 ** i) for i, mode in enumerate(_modes))
+        _operations[(_mode * 100) + _opcode] = _factory(_mode)
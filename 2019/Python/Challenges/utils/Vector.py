@@ -1,5 +1,4 @@
 from __future__ import annotations
-from dataclasses import dataclass
 from typing import Iterable, Iterator, Union, Optional
 from enum import Enum
 import math
@@ -8,18 +7,48 @@ import math
 Number = Union[int, float]
 
 
-@dataclass(frozen=True, order=True)
 class Vector:
     """
     An object representing a 2D vector
     """
 
     # region Fields
-    _x: Number = 0
-    _y: Number = 0
+    # The components are private slots only exposed through read-only properties, they must never be reassigned
+    # since the hash and the cached magnitude and normalized vector rely on them
+    __slots__ = ("__x", "__y", "_magnitude", "_normalized")
+    # endregion
+
+    # region Constructor
+    def __init__(self, x: Number = 0, y: Number = 0) -> None:
+        """
+        Creates a new Vector
+        :param x: X component
+        :param y: Y component
+        """
+
+        self.__x: Number = x
+        self.__y: Number = y
     # endregion
 
     # region Properties
+    @property
+    def _x(self) -> Number:
+        """
+        The X component of the vector, read-only
+        :return: X component
+        """
+
+        return self.__x
+
+    @property
+    def _y(self) -> Number:
+        """
+        The Y component of the vector, read-only
+        :return: Y component
+        """
+
+        return self.__y
+
     @property
     def x(self) -> Number:
         """
@@ -27,7 +56,7 @@ class Vector:
         :return: X component
         """
 
-        return self._x
+        return self.__x
 
     @property
     def y(self) -> Number:
@@ -36,25 +65,33 @@ class Vector:
         :return: Y component
         """
 
-        return self._y
+        return self.__y
 
     @property
     def magnitude(self) -> float:
         """
-        Calculates the magnitude of the vector
+        Calculates the magnitude of the vector, the components never change so it is only calculated once
         :return: Length/magnitude of the vector
         """
 
-        return math.sqrt((self._x ** 2) + (self._y ** 2))
+        try:
+            return self._magnitude
+        except AttributeError:
+            self._magnitude: float = math.sqrt((self.__x ** 2) + (self.__y ** 2))
+            return self._magnitude
 
     @property
     def normalized(self) -> Vector:
         """
-        Returns this vector normalized (of length 1)
+        Returns this vector normalized (of length 1), the components never change so it is only calculated once
         :return: The normalized vector
         """
 
-        return self / self.magnitude
+        try:
+            return self._normalized
+        except AttributeError:
+            self._normalized: Vector = self / self.magnitude
+            return self._normalized
     # endregion
 
     # region Static methods
@@ -67,7 +104,7 @@ class Vector:
         :return: The dot product of both vectors
         """
 
-        return (a._x * b._x) + (a._y * b._y)
+        return (a.__x * b.__x) + (a.__y * b.__y)
 
     @staticmethod
     def direction(a: Vector, direction: Optional[Vector] = None) -> float:
@@ -87,7 +124,7 @@ class Vector:
         :param b: Second vector:
         :return: The angle between a and b
         """
-        det: Number = (a._x * b._y) - (b._x * a._y)
+        det: Number = (a.__x * b.__y) - (b.__x * a.__y)
         angle: float = math.degrees(math.atan2(det, Vector.dot(a, b)))
         return angle if angle >= 0 else angle + 360
 
@@ -100,7 +137,7 @@ class Vector:
         :return: The Euclidean distance between a and b
         """
 
-        return math.sqrt(((a._x - b._x) ** 2) + ((a._y - b._y) ** 2))
+        return math.sqrt(((a.__x - b.__x) ** 2) + ((a.__y - b.__y) ** 2))
 
     @staticmethod
     def distance_rectilinear(a: Vector, b: Vector) -> Number:
@@ -111,7 +148,7 @@ class Vector:
         :return: The rectilinear (Manhattan) distance between a and b
         """
 
-        return abs(a._x - b._x) + abs(a._y - b._y)
+        return abs(a.__x - b.__x) + abs(a.__y - b.__y)
     # endregion
 
     # region Methods
@@ -130,7 +167,7 @@ class Vector:
         :return: Returns the same vector but with both it's components negated
         """
 
-        return Vector(-self._x, -self._y)
+        return Vector(-self.__x, -self.__y)
 
     def __add__(self, other: Vector) -> Vector:
         """
@@ -139,7 +176,7 @@ class Vector:
         :return: The resulting vector
         """
 
-        return Vector(self._x + other._x, self._y + other._y)
+        return Vector(self.__x + other.__x, self.__y + other.__y)
 
     def __sub__(self, other: Vector) -> Vector:
         """
@@ -148,7 +185,7 @@ class Vector:
         :return: The resulting vector
         """
 
-        return Vector(self._x - other._x, self._y - other._y)
+        return Vector(self.__x - other.__x, self.__y - other.__y)
 
     def __mul__(self, scalar: Number) -> Vector:
         """
@@ -157,7 +194,7 @@ class Vector:
         :return: Multiplied/scaled vector
         """
 
-        return Vector(self._x * scalar, self._y * scalar)
+        return Vector(self.__x * scalar, self.__y * scalar)
 
     def __truediv__(self, scalar: Number) -> Vector:
         """
@@ -166,7 +203,7 @@ class Vector:
         :return: Divided/scaled vector
         """
 
-        return Vector(self._x / scalar, self._y / scalar)
+        return Vector(self.__x / scalar, self.__y / scalar)
 
     def __floordiv__(self, scalar: int) -> Vector:
         """
@@ -175,7 +212,7 @@ class Vector:
         :return: Divided/scaled vector
         """
 
-        return Vector(self._x // scalar, self._y // scalar)
+        return Vector(self.__x // scalar, self.__y // scalar)
 
     def __abs__(self) -> Vector:
         """
@@ -183,7 +220,7 @@ class Vector:
         :return: Absolute value of the Vector
         """
 
-        return Vector(abs(self._x), abs(self._y))
+        return Vector(abs(self.__x), abs(self.__y))
 
     def __round__(self, ndigits: int = 0) -> Vector:
         """
@@ -192,7 +229,7 @@ class Vector:
         :return: The rounded vector
         """
 
-        return Vector(round(self._x, ndigits), round(self._y, ndigits))
+        return Vector(round(self.__x, ndigits), round(self.__y, ndigits))
 
     def __copy__(self) -> Vector:
         """
@@ -200,7 +237,62 @@ class Vector:
         :return: A new identical Vector
         """
 
-        return Vector(self._x, self._y)
+        return Vector(self.__x, self.__y)
+
+    def __eq__(self, other: Vector) -> bool:
+        """
+        Equality between two vectors
+        :param other: The other vector to compare to
+        :return: True if both vectors are equal, false otherwise
+        """
+
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.__x == other.__x and self.__y == other.__y
+
+    def __lt__(self, other: Vector) -> bool:
+        """
+        Less than comparison between two vectors, comparing the X components first, then the Y components
+        :param other: The other vector to compare to
+        :return: True if this vector is less than the other, false otherwise
+        """
+
+        return (self.__x, self.__y) < (other.__x, other.__y)
+
+    def __le__(self, other: Vector) -> bool:
+        """
+        Less or equal comparison between two vectors, comparing the X components first, then the Y components
+        :param other: The other vector to compare to
+        :return: True if this vector is less or equal to the other, false otherwise
+        """
+
+        return (self.__x, self.__y) <= (other.__x, other.__y)
+
+    def __gt__(self, other: Vector) -> bool:
+        """
+        Greater than comparison between two vectors, comparing the X components first, then the Y components
+        :param other: The other vector to compare to
+        :return: True if this vector is greater than the other, false otherwise
+        """
+
+        return (self.__x, self.__y) > (other.__x, other.__y)
+
+    def __ge__(self, other: Vector) -> bool:
+        """
+        Greater or equal comparison between two vectors, comparing the X components first, then the Y components
+        :param other: The other vector to compare to
+        :return: True if this vector is greater or equal to the other, false otherwise
+        """
+
+        return (self.__x, self.__y) >= (other.__x, other.__y)
+
+    def __hash__(self) -> int:
+        """
+        Hashes the vector
+        :return: The hash of the vector's components
+        """
+
+        return hash((self.__x, self.__y))
 
     def __iter__(self) -> Iterator[Number]:
         """
@@ -208,8 +300,8 @@ class Vector:
         :return: An iterator returning x, then y
         """
 
-        yield self._x
-        yield self._y
+        yield self.__x
+        yield self.__y
 
     def __str__(self) -> str:
         """
@@ -217,7 +309,15 @@ class Vector:
         :return: Nicely formatted string of the vector
         """
 
-        return f"({self._x}, {self._y})"
+        return f"({self.__x}, {self.__y})"
+
+    def __repr__(self) -> str:
+        """
+        Debug representation of the vector
+        :return: Constructor-like string of the vector
+        """
+
+        return f"{type(self).__name__}({self.__x}, {self.__y})"
     # endregion
 
 